@@ -1,11 +1,38 @@
-from copy import deepcopy
 import os
 import re
 import sys
 
 from argparse import ArgumentParser
+from functools import cache, wraps
+from itertools import count
+from typing import Callable, Iterator
 from tabbedboxmaker.InkexShapely import adjust_canvas
-from inkex import GenerateExtension, Transform
+from inkex import GenerateExtension, Style, Transform
+from inkex.units import CONVERSIONS
+
+
+@cache
+def line_style(color: str, width: str, hairline: bool = False) -> str:
+    """Return the serialized style attribute for a generated outline.
+
+    All outlines of a run share their style, so it is only serialized once;
+    assign the result to element.attrib["style"] to skip parsing it again."""
+    style = {"stroke": color, "stroke-width": width, "fill": "none"}
+    if hairline:
+        style["vector-effect"] = "non-scaling-stroke"
+        style["-inkscape-stroke"] = "hairline"
+    return str(Style(style))
+
+
+def _unless_shared(add_arguments: Callable) -> Callable:
+    """Wrap an add_arguments() so it does nothing when the instance reuses a shared parser."""
+
+    @wraps(add_arguments)
+    def wrapper(self, pars: ArgumentParser) -> None:
+        if self._shared_parser is None:
+            add_arguments(self, pars)
+
+    return wrapper
 
 
 class CliEnabledGenerator(GenerateExtension):
@@ -14,26 +41,54 @@ class CliEnabledGenerator(GenerateExtension):
     raw_hairline_thickness: float = None
     cli: bool = True
     cli_args: list[str] = []
-    nextId: dict[str, int] = {}
+    nextId: dict[str, Iterator[int]] = {}  # Id counter per prefix, see makeId()
     doument_unit: str = None
     container_layer: bool = True # Override inherited value to create in layer instead of group
+    _arg_parsers: dict[tuple, ArgumentParser] = {}  # Shared parsers, see parser_key()
+    _shared_parser: ArgumentParser | None = None  # Parser reused by this instance, if any
 
     def __init__(self, cli=True, inkscape=False):
         self.cli = cli
         self.inkscape = inkscape
 
+        # The options only depend on the parser_key() state, so the parser
+        # built for an earlier instance with the same key is reused: every
+        # add_arguments() is skipped (see __init_subclass__) and so is the CLI
+        # positional cleanup. inkex still creates its small base parser for
+        # every instance. parse_args() does not modify the parser, which makes
+        # sharing it safe.
+        key = self.parser_key()
+        self._shared_parser = CliEnabledGenerator._arg_parsers.get(key)
+
         super().__init__()
 
+        if self._shared_parser is not None:
+            self.arg_parser = self._shared_parser
+        else:
+            if self.cli:
+                # We don"t need a required input file in CLI mode
+                for action in self.arg_parser._get_positional_actions():
+                    self.arg_parser._remove_action(action)
+                    self.arg_parser._positionals._group_actions.remove(action)
+
+            CliEnabledGenerator._arg_parsers[key] = self.arg_parser
+
         self.cli_args = sys.argv[1:]  # Store command-line arguments for later use
-        self.nextId = { 'line': 0, 'rect': 0, 'circle': 0, 'path': 0, 'text': 0, 'side': 0, 'hole': 0, 'piece': 0, 'box': 0, 'slot': 0 }
+        self.nextId = {prefix: count(1) for prefix in ('line', 'rect', 'circle', 'path', 'text', 'side', 'hole', 'piece', 'box', 'slot')}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Applied here so no generator has to check _shared_parser itself
+        if "add_arguments" in cls.__dict__:
+            cls.add_arguments = _unless_shared(cls.__dict__["add_arguments"])
 
-        if self.cli:
-            # We don"t need a required input file in CLI mode
-            for action in self.arg_parser._get_positional_actions():
-                self.arg_parser._remove_action(action)
-                self.arg_parser._positionals._group_actions.remove(action)
+    def parser_key(self) -> tuple:
+        """Key for the argument parser cache; extend when add_arguments depends on more state."""
+        return (type(self), self.cli, self.inkscape)
 
+    @_unless_shared
     def add_arguments(self, pars : ArgumentParser) -> None:
+        """Define options; skipped when the instance reuses a shared parser."""
         super().add_arguments(pars)
         self.arg_parser.add_argument(
             '--unit',
@@ -58,7 +113,7 @@ class CliEnabledGenerator(GenerateExtension):
         """Parse the given arguments and set 'self.options'"""
 
         super().parse_arguments(args)
-        self.cli_args = deepcopy(args)
+        self.cli_args = list(args)
 
         if not hasattr(self.options, "input_file"):
             self.options.input_file = os.path.join(os.path.dirname(__file__), "blank.svg")
@@ -104,16 +159,36 @@ class CliEnabledGenerator(GenerateExtension):
             adjust_canvas(self.svg, unit=self.document_unit)
 
 
+    def unit_converter(self, unit: str) -> Callable[[float], float]:
+        """Return a function converting numbers in unit to document user units.
+
+        Same result as self.svg.unittouu(str(value) + unit), but the unit
+        lookup happens once instead of formatting and parsing a string per value.
+        Unlike unittouu, which turns every value into 0.0, an unknown unit
+        raises ValueError.
+        """
+
+        from_unit = CONVERSIONS.get(unit)
+        to_unit = CONVERSIONS.get(self.svg.unit)
+        if from_unit is None:
+            raise ValueError(f"Unknown unit: {unit!r}")
+        if to_unit is None:
+            raise ValueError(f"Unknown document unit: {self.svg.unit!r}")
+
+        return lambda value: float(value) * from_unit / to_unit
+
     def makeId(self, prefix: str | None) -> str:
         """Generate a new unique ID with the given prefix."""
 
         prefix = prefix if prefix is not None else "id"
-        if prefix not in self.nextId:
-            id = self.nextId[prefix] = -1
+        counter = self.nextId.get(prefix)
+        if counter is None:
+            # Other prefixes use the bare prefix for their first id
+            counter = self.nextId[prefix] = count(0)
 
-        self.nextId[prefix] = id = self.nextId[prefix] + 1
+        id = next(counter)
 
         if id == 0:
             return prefix
         else:
-            return f"{prefix}_{id:03d}"
+            return "%s_%03d" % (prefix, id)
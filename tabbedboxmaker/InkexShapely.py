@@ -30,12 +30,8 @@ def fstr(f: float) -> str:
     if f.is_integer():
         return str(int(f))
 
-    r = str(f)
-
-    if r.endswith('.0'):
-        return r[:-2]
-    else:
-        return r
+    # A non-integral float never formats with a trailing '.0'
+    return repr(f)
 
 
 def path_to_polygon(path_obj : inkex.Path):
@@ -45,14 +41,12 @@ def path_to_polygon(path_obj : inkex.Path):
 
     paths = []
     for seg in path_obj:
-        if seg.letter == 'M':
-            coords.append((seg.x, seg.y))
-        elif seg.letter == 'L':
+        kind = type(seg)
+        if kind is Move or kind is Line:
             coords.append((seg.x, seg.y))
-        elif seg.letter in 'Zz':
+        elif kind is ZoneClose or kind is inkex.paths.zoneClose:
             paths.append(coords)
             coords = []
-            continue
         else:
             raise AssertionError(f"Unexpected path segment type: {seg.letter}")
 
@@ -66,23 +60,37 @@ def path_to_polygon(path_obj : inkex.Path):
     return None
 
 
-def polygon_to_path(poly):
+# Point format used by inkex when serializing Move/Line commands
+_POINT_FORMAT = f"{Line.number_template} {Line.number_template}"
+
+
+def points_to_d(points: list, close: bool = True, offset: tuple[float, float] | None = None) -> str:
+    """Return SVG path data for a polygon (or an open polyline when close is
+    False), formatted exactly as str(inkex.Path) would. When given, offset
+    is added to every point as it is formatted."""
+    fmt = _POINT_FORMAT.format
+    if offset is None:
+        d = "M " + " L ".join([fmt(*p) for p in points])
+    else:
+        ox, oy = offset
+        d = "M " + " L ".join([fmt(x + ox, y + oy) for x, y in points])
+    return d + " Z" if close else d
+
+
+def polygon_rings(poly) -> list:
+    """Return the coordinate rings of a shapely Polygon or MultiPolygon in
+    output order: each exterior followed by its holes in a stable order."""
     from shapely.geometry import Polygon, MultiPolygon, LinearRing
-    # Accepts shapely Polygon or MultiPolygon, returns inkex.Path string
 
-    path = inkex.Path()
+    rings = []
 
-    def add_polygon_to_path(polygon: Polygon, path: inkex.Path):
-        coords = list(polygon.exterior.coords)
-        path.append(Move(coords[0][0], coords[0][1]))
-        for x, y in coords[1:]:
-            path.append(Line(x, y))
-        path.append(ZoneClose())
+    def add_polygon_rings(polygon: Polygon):
+        rings.append(polygon.exterior.coords)
 
         # Add holes in stable order
         interiors = list(polygon.interiors)
 
-        for i in interiors:
+        for index, i in enumerate(interiors):
             coords = list(i.coords)
 
             if len(coords) > 3:
@@ -102,28 +110,30 @@ def polygon_to_path(poly):
                     rotated_coords.append(rotated_coords[0])
                     # Update the interior ring with rotated coordinates
 
-                    interiors[interiors.index(i)] = LinearRing(rotated_coords)
+                    interiors[index] = LinearRing(rotated_coords)
 
         # Sort by first coordinate (X, then Y)
         interiors.sort(key=lambda ring: f"{ring.coords[0][0]},{ring.coords[0][1]}")
 
         for interior in interiors:
-            coords = list(interior.coords)
-            path.append(Move(coords[0][0], coords[0][1]))
-            for x, y in coords[1:]:
-                path.append(Line(x, y))
-            path.append(ZoneClose())
+            rings.append(interior.coords)
 
     # Handle both Polygon and MultiPolygon
     if isinstance(poly, MultiPolygon):
         for polygon in poly.geoms:
-            add_polygon_to_path(polygon, path)
+            add_polygon_rings(polygon)
     elif isinstance(poly, Polygon):
-        add_polygon_to_path(poly, path)
+        add_polygon_rings(poly)
     else:
         raise ValueError(f"Expected Polygon or MultiPolygon, got {type(poly)}")
 
-    return path
+    return rings
+
+
+def polygon_to_d(poly) -> str:
+    """Convert a shapely Polygon or MultiPolygon to SVG path data, with each
+    ring written as a closed M/L/Z subpath in inkex's number format."""
+    return " ".join([points_to_d(coords) for coords in polygon_rings(poly)])
 
 def best_effort_inkex_combine_paths(paths: list[inkex.PathElement], force_interiors=False):
     panel = paths[0]
@@ -133,22 +143,22 @@ def best_effort_inkex_combine_paths(paths: list[inkex.PathElement], force_interi
     panel_bb = panel.bounding_box()
     combined_superpath = panel.path.to_superpath()
 
-    ignore_holes = []
+    ignore_holes = set()  # ids of the holes that were combined already
 
     # Ok, now combine holes using our very simple combiner.
     # LIMITATION: Any hole can be combined only once, so we keep track of which ones
     # have already been combined.
     for hole in holes:
-        hole_bb = hole.bounding_box()
-
-        if hole not in ignore_holes:
+        if id(hole) not in ignore_holes and len(hole.path) == 5:
+            hole_bb = hole.bounding_box()
             for other in holes:
-                if hole_bb & other.bounding_box() and other != hole and other not in ignore_holes and len(hole.path) == 5 and len(other.path) == 5:
+                # Cheap checks first; the bounding box has to be calculated
+                if other is not hole and id(other) not in ignore_holes and len(other.path) == 5 and hole_bb & other.bounding_box():
                     # Merge the two holes
                     new_path = merge_two_rectangles_to_outer_path(hole, other)
                     hole.path = new_path
-                    ignore_holes.append(other)
-                    ignore_holes.append(hole)
+                    ignore_holes.add(id(other))
+                    ignore_holes.add(id(hole))
                     group.remove(other)
                     holes.remove(other)
                     break
@@ -175,7 +185,10 @@ def best_effort_inkex_combine_paths(paths: list[inkex.PathElement], force_interi
 
 
 def try_attach_paths(group: list[inkex.BaseElement], tolerance: float = 0.01, reverse: bool = False, replace_group=False) -> bool:
-    """Try to attach paths end-to-start if they are close enough, and close paths if start and end meet."""
+    """Try to attach paths end-to-start if they are close enough, and close paths if start and end meet.
+
+    Attached paths are removed from their parent element and, when group is
+    a plain list, from the list as well."""
     updated_one = False
     for i in group:
         if isinstance(i, inkex.Group):
@@ -184,74 +197,111 @@ def try_attach_paths(group: list[inkex.BaseElement], tolerance: float = 0.01, re
 
     if len(group) > 1:
         paths = [x for x in group if isinstance(x, inkex.PathElement) and len(x.path) > 1]
-        skip_elements = []
-
+        current = []  # Absolute path of each element, kept up to date while merging
         for path_element in paths:
             path = path_element.path
-
-            if any(i is path_element for i in skip_elements):
-                continue
-            elif any(el for el in path if isinstance(el, inkex.paths.RelativePathCommand)):
+            if any(el for el in path if isinstance(el, inkex.paths.RelativePathCommand)):
                 path_element.path = path = path.to_absolute()
+            current.append(path)
+
+        # Open path ends are indexed in a grid of tolerance sized cells, so
+        # only the paths near an end point have to be compared
+        cell_x = 0.01
+        cell_y = tolerance if tolerance > 0 else 0.01
+        firsts: dict[tuple[int, int], list[int]] = {}
+        lasts: dict[tuple[int, int], list[int]] = {}
+
+        def cell(point) -> tuple[int, int]:
+            return (math.floor(point.x / cell_x), math.floor(point.y / cell_y))
+
+        for index, path in enumerate(current):
+            if not isinstance(path[-1], inkex.paths.ZoneClose):
+                firsts.setdefault(cell(path[0]), []).append(index)
+                lasts.setdefault(cell(path[-1]), []).append(index)
+
+        def candidates(point) -> list[int]:
+            cx, cy = cell(point)
+            found = set()
+            for x in (cx - 1, cx, cx + 1):
+                for y in (cy - 1, cy, cy + 1):
+                    found.update(firsts.get((x, y), ()))
+                    found.update(lasts.get((x, y), ()))
+            return sorted(found)
+
+        skipped = set()
+
+        for index, path_element in enumerate(paths):
+            if index in skipped:
+                continue
 
+            path = current[index]
             path_last = path[-1]
 
             if isinstance(path_last, inkex.paths.ZoneClose):
                 continue  # Path is already closed
 
+            # The merged path is only written back to the element once
+            changed = False
             loop = True
             while loop:
                 loop = False
 
-                for other_element in paths:
-                    if any(i is other_element for i in skip_elements) or other_element is path_element:
-                        continue
+                last_x, last_y = path_last.x, path_last.y
 
-                    other_path = Path(other_element.path)
+                # Same order as scanning all paths, so the same path is attached
+                for other_index in candidates(path_last):
+                    if other_index in skipped or other_index == index:
+                        continue
 
-                    if any(el for el in other_path if isinstance(el, inkex.paths.RelativePathCommand)):
-                        other_element.path = other_path = Path(other_path.to_absolute())
+                    other_element = paths[other_index]
+                    other_path = current[other_index]
 
                     if isinstance(other_path[-1], inkex.paths.ZoneClose):
                         continue  # Path is already closed
 
                     (other_first, other_last) = (other_path[0], other_path[-1])
 
-                    if math.fabs(other_first.x-path_last.x) < 0.01 and math.fabs(other_first.y - path_last.y) < tolerance:
-                        new_id = min(path_element.get_id(), other_element.get_id())
-                        path_element.path = path = Path(path + other_path[1:])
-                        other_element.getparent().remove(other_element)
-                        path_element.set_id(new_id)
-                        skip_elements.append(other_element)
-
-                        # Update step for next iteration
-                        path_last = path[-1]
-                        updated_one = loop = True
-                        break
-                    elif math.fabs(other_last.x-path_last.x) < 0.01 and math.fabs(other_last.y - path_last.y) < tolerance:
-                        new_id = min(path_element.get_id(), other_element.get_id())
-                        path_element.path = path = Path(path + other_path.reverse()[1:])
-                        #print(other_element.get_id(), file=sys.stderr)
-                        other_element.getparent().remove(other_element)
-                        path_element.set_id(new_id)
-                        skip_elements.append(other_element)
-
-                        # Update step for next iteration
-                        path_last = path[-1]
-                        updated_one = loop = True
-                        break
+                    if abs(other_first.x - last_x) < 0.01 and abs(other_first.y - last_y) < tolerance:
+                        new_path = Path(path + other_path[1:])
+                    elif abs(other_last.x - last_x) < 0.01 and abs(other_last.y - last_y) < tolerance:
+                        new_path = Path(path + other_path.reverse()[1:])
+                    else:
+                        continue
 
+                    new_id = min(path_element.get_id(), other_element.get_id())
+                    path = current[index] = new_path
+                    changed = True
+                    other_element.getparent().remove(other_element)
+                    path_element.set_id(new_id)
+                    skipped.add(other_index)
+
+                    # Update step for next iteration
+                    lasts[cell(path_last)].remove(index)
+                    path_last = path[-1]
+                    lasts.setdefault(cell(path_last), []).append(index)
+                    updated_one = loop = True
+                    break
 
-            if isinstance(path_last, inkex.paths.ZoneClose) or isinstance(path_last, inkex.paths.zoneClose):
-                continue  # Path is already closed. Not sure why we only see this now
-            elif path_last.x == path[0].x and path_last.y == path[0].y:
+            closed = isinstance(path_last, inkex.paths.ZoneClose) or isinstance(path_last, inkex.paths.zoneClose)
+            if not closed and path_last.x == path[0].x and path_last.y == path[0].y:
                 if reverse:
                     path = path.reverse() # Ensure correct winding order
 
                 path.append(inkex.paths.ZoneClose())
+                changed = True
+
+            if changed:
                 path_element.path = path
 
+            if closed:
+                continue  # Path is already closed. Not sure why we only see this now
+
             try_clean_paths([path_element])
+            current[index] = path_element.path
+
+        if skipped and isinstance(group, list):
+            attached = {id(paths[index]) for index in skipped}
+            group[:] = [x for x in group if id(x) not in attached]
 
     if replace_group and isinstance(group, inkex.Group) and len(group) == 1:
         parent = group.getparent()
@@ -275,66 +325,70 @@ def try_clean_paths(paths: list[inkex.BaseElement]):
 
         updated = False
         simplified_path = []
-        prev = None  # Previous point
+        append = simplified_path.append
+        prev_kind = None  # Line, Move or None when there is no previous point
+        px = py = 0.0  # Previous point
         current_dir = None  # Current direction
 
         for segment in path:
-            if isinstance(segment, inkex.paths.ZoneClose):
-                simplified_path.append(segment)
-            elif isinstance(segment, inkex.paths.Line):
-                if isinstance(prev, inkex.paths.Line):
-                    dx = round(segment.x - prev.x, 8)
-                    dy = round(segment.y - prev.y, 8)
+            kind = type(segment)
+            if kind is ZoneClose:
+                append(segment)
+            elif kind is Line:
+                x, y = segment.x, segment.y
+                if prev_kind is not None:
+                    dx = round(x - px, 8)
+                    dy = round(y - py, 8)
                     if dx == 0 and dy == 0:
                         updated = True
                         continue  # Skip node
                     # Determine the direction
-                    direction = (
-                        0 if dx == 0 else math.copysign(1, dx),
-                        0 if dy == 0 else math.copysign(1, dy),
-                    )
-                    if (dx == 0 or dy == 0) and direction == current_dir:
+                    direction = ((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
+                    if prev_kind is Line and (dx == 0 or dy == 0) and direction == current_dir:
                         # Skip redundant points on straight lines
                         # Replace the last point with the current point
                         simplified_path[-1] = segment
                         updated = True
                     else:
-                        simplified_path.append(segment)
+                        append(segment)
                     current_dir = direction
                 else:
-                    if prev is not None:
-                        dx = round(segment.x - prev.x, 8)
-                        dy = round(segment.y - prev.y, 8)
-                        if dx == 0 and dy == 0:
-                            updated = True
-                            continue  # Skip node
-
-                        # Determine the direction
-                        direction = (
-                            0 if dx == 0 else math.copysign(1, dx),
-                            0 if dy == 0 else math.copysign(1, dy),
-                        )
-                        current_dir = direction
-                    else:
-                        current_dir = None
-                    simplified_path.append(segment)
-                prev = segment
-            elif isinstance(segment, inkex.paths.Move):
-                simplified_path.append(segment)
-                prev = segment
+                    current_dir = None
+                    append(segment)
+                prev_kind = Line
+                px, py = x, y
+            elif kind is Move:
+                append(segment)
+                prev_kind = Move
+                px, py = segment.x, segment.y
                 current_dir = None
-                direction = None
             else:
-                simplified_path.append(segment)
-                prev = None
+                append(segment)
+                prev_kind = None
                 current_dir = None
-                direction = None
 
         if updated:
             path_element.path = simplified_path
 
 
 
+def round_paths(paths: list[inkex.BaseElement], decimals: int) -> None:
+    """Round the Move and Line coordinates of the given paths to a fixed number
+    of decimals. Arc elements are left alone, as their d must stay in sync
+    with their sodipodi attributes."""
+
+    for path_element in paths:
+        if not isinstance(path_element, inkex.PathElement) or path_element.get("sodipodi:type") == "arc":
+            continue
+
+        # Adding 0.0 turns a rounded -0.0 into 0.0, so it isn't written as "-0"
+        path_element.path = [
+            type(segment)(round(segment.x, decimals) + 0.0, round(segment.y, decimals) + 0.0)
+            if isinstance(segment, (Move, Line)) else segment
+            for segment in path_element.path
+        ]
+
+
 def try_combine_paths(paths: list[PathElement], inkscape: bool = False, no_subtract: bool = False, force_interiors=False):
     if len(paths) < 2:
         return
@@ -346,6 +400,7 @@ def try_combine_paths(paths: list[PathElement], inkscape: bool = False, no_subtr
         return best_effort_inkex_combine_paths(paths, force_interiors)
 
     try:
+        import shapely
         from shapely.ops import unary_union
         panel = paths[0]
         group = panel.getparent()
@@ -360,11 +415,22 @@ def try_combine_paths(paths: list[PathElement], inkscape: bool = False, no_subtr
                     group.remove(candidate)
                     holes.append(poly)
 
-            # Subtract holes from panel
-            result = panel_poly.difference(unary_union(holes))
+            # Holes that do not touch the panel cannot change it; test them
+            # all against the prepared panel at once and leave them out
+            if len(holes) > 1:
+                shapely.prepare(panel_poly)
+                touching = shapely.intersects(panel_poly, holes)
+                if not touching.all():
+                    holes = [hole for hole, keep in zip(holes, touching) if keep]
+
+            # Subtract holes from panel, unioning all of them in one GEOS call
+            if len(holes) == 1:
+                result = panel_poly.difference(holes[0])
+            else:
+                result = panel_poly.difference(unary_union(holes))
 
             # Replace panel path with result
-            panel.path = polygon_to_path(result)
+            panel.set("d", polygon_to_d(result))
     except Exception as e:
         return best_effort_inkex_combine_paths(paths)
 
@@ -372,17 +438,26 @@ def adjust_canvas(svg,
                   unit: str | None = None) -> None:
     """ Adjust the SVG canvas to fit the content """
     layer = svg.get_current_layer()
-    # Collect all bboxes
-    all_bboxes = []
+    # Combine all bboxes in one pass; like min()/max(), keep the first of equal values
+    left = top = math.inf
+    right = bottom = -math.inf
     for el in layer.descendants():
         if isinstance(el, inkex.PathElement):
-            all_bboxes.append(el.bounding_box())
-
-    if all_bboxes:
-        minx = min(min(b.left for b in all_bboxes), 0)
-        miny = min(min(b.top for b in all_bboxes), 0)
-        maxx = max(max(b.right for b in all_bboxes), 0)
-        maxy = max(max(b.bottom for b in all_bboxes), 0)
+            b = el.bounding_box()
+            if b.left < left:
+                left = b.left
+            if b.top < top:
+                top = b.top
+            if b.right > right:
+                right = b.right
+            if b.bottom > bottom:
+                bottom = b.bottom
+
+    if left != math.inf:
+        minx = min(left, 0)
+        miny = min(top, 0)
+        maxx = max(right, 0)
+        maxy = max(bottom, 0)
         width = maxx - minx + 1
         height = maxy - miny + 1
         svg.set('width', fstr(width) + unit if unit else svg.unit)
@@ -24,9 +24,12 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 # For exporting
 from tabbedboxmaker.livinghinge import LivingHingeBoxMaker
 from tabbedboxmaker.cardboard import CardboardBoxMaker
-from tabbedboxmaker.boxmaker import TabbedBoxMaker
+from tabbedboxmaker.boxmaker import TabbedBoxMaker, BoxMakerValidationError
 
 if __name__ == "__main__":
     # Create effect instance and apply it.
     effect = TabbedBoxMaker(cli=True)
-    effect.run()
+    try:
+        effect.run()
+    except BoxMakerValidationError:
+        exit(1)
@@ -26,22 +26,30 @@ import math
 import os
 import gettext
 import sys
-from copy import deepcopy
 
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from types import MappingProxyType
 from inkex import Group, PathElement, Metadata, Desc
-from inkex.paths import Path
-from inkex.paths.lines import Line, Move, ZoneClose
 
-from tabbedboxmaker.InkexShapely import try_combine_paths, try_attach_paths, try_clean_paths
+from tabbedboxmaker.InkexShapely import try_combine_paths, try_attach_paths, try_clean_paths, points_to_d, round_paths
 from tabbedboxmaker.__about__ import __version__ as BOXMAKER_VERSION
 from tabbedboxmaker.boxmakerSettings import BoxSettings, BoxConfiguration, TabConfiguration, Piece, SchroffSettings, Side, Vec, BoxType, Layout, TabSymmetry, DividerKeying, Sides, PieceType
-from tabbedboxmaker.Generators import CliEnabledGenerator
+from tabbedboxmaker.Generators import CliEnabledGenerator, line_style
 
 _ = gettext.gettext
 
-def log(text: str) -> None:
-    if "STDERR_LOG" in os.environ:
-        print(text, file=sys.stderr)
+# Checked once; call sites test it before formatting their messages, or
+# pass %-style arguments so that log only formats them when enabled
+_LOG_ENABLED = "STDERR_LOG" in os.environ
+
+def log(text: str, *args) -> None:
+    if _LOG_ENABLED:
+        print(text % args if args else text, file=sys.stderr)
+
+class BoxMakerValidationError(ValueError):
+    """Raised when the box settings are invalid; the errors have already
+    been reported through inkex.errormsg"""
 
 def IntBoolean(value):
     """ArgParser function to turn a boolean string into a python boolean"""
@@ -55,6 +63,323 @@ def IntBoolean(value):
             return True
     return b
 
+# Grid cell (column index, row index) of each face for each layout; faces
+# after Back and Left are placed in the order listed here
+_LAYOUT_CELLS: dict[Layout, dict[PieceType, tuple[int, int]]] = {
+    Layout.DIAGRAMMATIC: {
+        PieceType.Back: (1, 2), PieceType.Left: (0, 1), PieceType.Bottom: (1, 1),
+        PieceType.Right: (2, 1), PieceType.Top: (3, 1), PieceType.Front: (1, 0),
+    },
+    Layout.THREE_PIECE: {
+        PieceType.Back: (1, 1), PieceType.Left: (0, 0), PieceType.Bottom: (1, 0),
+    },
+    Layout.INLINE_COMPACT: {
+        PieceType.Back: (4, 0), PieceType.Left: (2, 0), PieceType.Top: (0, 0),
+        PieceType.Bottom: (1, 0), PieceType.Right: (3, 0), PieceType.Front: (5, 0),
+    },
+}
+
+# Pieces included for each box type
+_PIECE_TYPES_BY_BOXTYPE: dict[BoxType, tuple[PieceType, ...]] = {
+    BoxType.FULLY_ENCLOSED: (PieceType.Back, PieceType.Left, PieceType.Bottom, PieceType.Right, PieceType.Top, PieceType.Front),
+    BoxType.ONE_SIDE_OPEN: (PieceType.Bottom, PieceType.Front, PieceType.Back, PieceType.Left, PieceType.Right),
+    BoxType.TWO_SIDES_OPEN: (PieceType.Bottom, PieceType.Front, PieceType.Left, PieceType.Right),
+    BoxType.THREE_SIDES_OPEN: (PieceType.Bottom, PieceType.Front, PieceType.Left),
+    BoxType.OPPOSITE_ENDS_OPEN: (PieceType.Back, PieceType.Left, PieceType.Right, PieceType.Front),
+    BoxType.TWO_PANELS_ONLY: (PieceType.Left, PieceType.Bottom),
+}
+
+# Tab info (<abcd>, 0=holes 1=tabs) per tab symmetry, indexed by TabSymmetry,
+# in the order top, bottom, left, right, front, back
+_TAB_INFO_BY_SYMMETRY: tuple[tuple[int, int, int, int, int, int], ...] = (
+    (0b0000, 0b0000, 0b1111, 0b1111, 0b1010, 0b1010),  # XY symmetric
+    (0b1111, 0b1111, 0b1111, 0b1111, 0b1111, 0b1111),  # Rotationally symmetric (Waffle-blocks)
+    (0b0110, 0b1100, 0b1100, 0b0110, 0b1100, 0b1001),  # Antisymmetric (deprecated)
+)
+
+# Per-side flags (Sides order A..D) for each 4-bit <abcd> tab value
+_TAB_BITS: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(bool(bits >> (3 - name) & 1) for name in range(4)) for bits in range(16)
+)
+
+# For each box face: the tab bits (<abcd>, a=top ... d=left) to clear on
+# the neighbouring faces when that face is not part of the box
+_MISSING_FACE_TAB_BITS: dict[PieceType, tuple[tuple[PieceType, int], ...]] = {
+    PieceType.Top: ((PieceType.Back, 0b0010), (PieceType.Front, 0b1000),
+                    (PieceType.Left, 0b0001), (PieceType.Right, 0b0100)),
+    PieceType.Bottom: ((PieceType.Back, 0b1000), (PieceType.Front, 0b0010),
+                       (PieceType.Left, 0b0100), (PieceType.Right, 0b0001)),
+    PieceType.Front: ((PieceType.Top, 0b1000), (PieceType.Bottom, 0b1000),
+                      (PieceType.Left, 0b1000), (PieceType.Right, 0b1000)),
+    PieceType.Back: ((PieceType.Top, 0b0010), (PieceType.Bottom, 0b0010),
+                     (PieceType.Left, 0b0010), (PieceType.Right, 0b0010)),
+    PieceType.Left: ((PieceType.Top, 0b0100), (PieceType.Bottom, 0b0001),
+                     (PieceType.Back, 0b0001), (PieceType.Front, 0b0001)),
+    PieceType.Right: ((PieceType.Top, 0b0001), (PieceType.Bottom, 0b0100),
+                      (PieceType.Back, 0b0100), (PieceType.Front, 0b0100)),
+}
+
+
+@cache
+def _tabbed_bits(present: frozenset[PieceType]) -> Mapping[PieceType, int]:
+    """Tab bits per face once the faces missing from the box are cleared.
+
+    The result is cached, so it is returned as a read-only view."""
+    tabbed = dict.fromkeys(_MISSING_FACE_TAB_BITS, 0b1111)
+    for face, clears in _MISSING_FACE_TAB_BITS.items():
+        if face not in present:
+            for other, bit in clears:
+                tabbed[other] &= ~bit
+            tabbed[face] = 0
+    return MappingProxyType(tabbed)
+
+
+# Command line options as (flag, add_argument keywords), in --help order:
+# the Schroff rail options, or the outer size for regular boxes, then the
+# options shared by both
+_SCHROFF_ARGUMENTS: tuple[tuple[str, dict], ...] = (
+    ("--rail_height", dict(
+        type=float,
+        dest="rail_height",
+        default=10.0,
+        help="Height of rail (float)",
+    )),
+    ("--rail_mount_depth", dict(
+        type=float,
+        dest="rail_mount_depth",
+        default=17.4,
+        help="Depth at which to place hole for rail mount bolt (float)",
+    )),
+    ("--rail_mount_centre_offset", dict(
+        type=float,
+        dest="rail_mount_centre_offset",
+        default=0.0,
+        help="How far toward row centreline to offset rail mount bolt (from rail centreline) (float)",
+    )),
+    ("--rows", dict(
+        type=int,
+        dest="rows",
+        default=0,
+        help="Number of Schroff rows (int)",
+    )),
+    ("--hp", dict(
+        type=int,
+        dest="hp",
+        default=0,
+        help="Width (TE/HP units) of Schroff rows (int)",
+    )),
+    ("--row_spacing", dict(
+        type=float,
+        dest="row_spacing",
+        default=10.0,
+        help="Height of rail (float)",
+    )),
+)
+
+_BOX_ARGUMENTS: tuple[tuple[str, dict], ...] = (
+    ("--inside", dict(
+        type=IntBoolean,
+        dest="inside",
+        default=0,
+        help="Int/Ext Dimension",
+        choices=[True, False, '0', '1'],
+    )),
+    ("--length", dict(
+        type=float,
+        dest="length",
+        default=100,
+        help="Length of Box (float)",
+    )),
+    ("--width", dict(
+        type=float,
+        dest="width",
+        default=100,
+        help="Width of Box (float)",
+    )),
+)
+
+_COMMON_ARGUMENTS: tuple[tuple[str, dict], ...] = (
+    ("--depth", dict(
+        type=float,
+        dest="height",
+        default=100,
+        help="Height of Box (float)",
+    )),
+    ("--tab", dict(
+        type=float,
+        dest="tab",
+        default=5,
+        help="Nominal Tab Width (float)",
+    )),
+    ("--equal", dict(
+        type=IntBoolean,
+        dest="equal_tabs",
+        default=False,
+        help="Equal/Prop Tabs",
+        choices=[True, False, '0', '1'],
+    )),
+    ("--tabsymmetry", dict(
+        type=int,
+        dest="tabsymmetry",
+        default=0,
+        help="Tab style (0=XY symmetric, 1=Rotationally symmetric, 2=Antisymmetric)",
+        choices=[0, 1, 2],
+    )),
+    ("--tabtype", dict(
+        type=IntBoolean,
+        dest="tabtype",
+        default=False,
+        help="Tab type: 0=regular or 1=dogbone",
+        choices=[0, 1],
+    )),
+    ("--dimpleheight", dict(
+        type=float,
+        dest="dimpleheight",
+        default=0,
+        help="Tab Dimple Height",
+    )),
+    ("--dimplelength", dict(
+        type=float,
+        dest="dimplelength",
+        default=0,
+        help="Tab Dimple Tip Length",
+    )),
+    ("--hairline", dict(
+        type=IntBoolean,
+        dest="hairline",
+        default=False,
+        help="Line Thickness (True/False)",
+        choices=[True, False, '0', '1'],
+    )),
+    ("--line-thickness", dict(
+        type=float,
+        dest="line_thickness",
+        default=0.1,
+        help="Line Thickness (if not hairline)",
+    )),
+    ("--line-color", dict(
+        type=str,
+        dest="color",
+        default="black",
+        help="Line Color",
+        choices=["black", "red", "blue", "green"],
+    )),
+    ("--thickness", dict(
+        type=float,
+        dest="thickness",
+        default=5.0,
+        help="Thickness of Material",
+    )),
+    ("--kerf", dict(
+        type=float,
+        dest="kerf",
+        default=0,
+        help="Kerf (width of cut)",
+    )),
+    ("--style", dict(
+        type=int,
+        dest="style",
+        default=1,
+        help="Layout/Style",
+    )),
+    ("--spacing", dict(
+        type=float,
+        dest="spacing",
+        default=3,
+        help="Part Spacing",
+    )),
+    ("--boxtype", dict(
+        type=int,
+        dest="boxtype",
+        default=1,
+        help="Box type",
+    )),
+    ("--div-l", dict(
+        type=int,
+        dest="div_x",
+        default=0,
+        help="Dividers (Length axis / X axis)",
+    )),
+    ("--div-w", dict(
+        type=int,
+        dest="div_y",
+        default=0,
+        help="Dividers (Width axis / Y axis)",
+    )),
+    ("--keydiv", dict(
+        type=int,
+        dest="keydiv",
+        default=3,
+        help="Key dividers into walls/floor",
+    )),
+    ("--div-l-spacing", dict(
+        type=str,
+        dest="div_x_spacing",
+        default="",
+        help="Custom spacing for X-axis dividers (semicolon separated widths)",
+    )),
+    ("--div-w-spacing", dict(
+        type=str,
+        dest="div_y_spacing",
+        default="",
+        help="Custom spacing for Y-axis dividers (semicolon separated widths)",
+    )),
+    ("--combine", dict(
+        type=IntBoolean,
+        dest="combine",
+        default=True,
+        help="Combine and clean paths",
+        choices=[True, False, '0', '1'],
+    )),
+    ("--cutout", dict(
+        type=IntBoolean,
+        dest="cutout",
+        default=True,
+        help="Cut holes from parent pieces",
+        choices=[True, False, '0', '1'],
+    )),
+    ("--dovetail-position", dict(
+        type=str,
+        default=None,
+        help="Where to put dovetail joints",
+        choices=["None", "All", "NoTop"],
+    )),
+    ("--dovetail-size", dict(
+        type=float,
+        default=1.5,
+        help="Size of dovetail joints (in thickness units)",
+    )),
+    ("--dovetail-angle", dict(
+        type=int,
+        help="Angle of dovetail joints (degrees)",
+        default=50,
+        choices=[30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80],
+    )),
+    ("--dovetail-spacing", dict(
+        type=float,
+        default=2.0,
+        help="Spacing of dovetail joints (in thickness units)",
+    )),
+    ("--dovetail-offset", dict(
+        type=float,
+        default=1.0,
+        help="Offset of dovetail joints (in thickness units)",
+    )),
+    ("--dovetail-male", dict(
+        type=IntBoolean,
+        default=True,
+        help="Whether to use male dovetail joints",
+        choices=[True, False, '0', '1'],
+    )),
+    ("--coordinate-decimals", dict(
+        type=int,
+        dest="coordinate_decimals",
+        default=None,
+        help="Round line coordinates to this many decimals (default: full precision)",
+    )),
+)
+
+
 class TabbedBoxMaker(CliEnabledGenerator):
     line_thickness: float = 1
     version = BOXMAKER_VERSION
@@ -74,6 +399,9 @@ class TabbedBoxMaker(CliEnabledGenerator):
         # Call the base class constructor.
         super().__init__(cli=cli, inkscape=inkscape)
 
+    def parser_key(self) -> tuple:
+        return super().parser_key() + (self.schroff,)
+
     def makeGroup(self, id="piece") -> Group:
         # Create a new group and add element created from line string
         group = Group(id=self.makeId(id))
@@ -84,22 +412,26 @@ class TabbedBoxMaker(CliEnabledGenerator):
         line = PathElement(id=self.makeId(id))
 
         if self.line_thickness == self.raw_hairline_thickness:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.hairline_thickness), "fill": "none", "vector-effect": "non-scaling-stroke", "-inkscape-stroke": "hairline"}
+            line.attrib["style"] = line_style(self.line_color, str(self.hairline_thickness), hairline=True)
+        else:
+            line.attrib["style"] = line_style(self.line_color, str(self.line_thickness))
+        if isinstance(path, str):
+            line.set("d", path)  # Preformatted path data, no need to parse it again
         else:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.line_thickness), "fill": "none" }
-        line.path = Path(path)
+            # Accepts a Path or a list of commands/points; set_path converts it once
+            line.path = path
         return line
 
 
 
     def makeCircle(self, r, c, id : str = "circle"):
         (cx, cy) = c
-        log("putting circle at (%d,%d)" % (cx,cy))
+        log("putting circle at (%d,%d)", cx, cy)
         line = PathElement.arc((cx, cy), r, id=self.makeId(id))
         if self.line_thickness == self.hairline_thickness:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.hairline_thickness), "fill": "none", "vector-effect": "non-scaling-stroke", "-inkscape-stroke": "hairline" }
+            line.attrib["style"] = line_style(self.line_color, str(self.hairline_thickness), hairline=True)
         else:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.line_thickness), "fill": "none" }
+            line.attrib["style"] = line_style(self.line_color, str(self.line_thickness))
         return line
 
 
@@ -109,272 +441,8 @@ class TabbedBoxMaker(CliEnabledGenerator):
 
         super().add_arguments(pars)
 
-        if self.schroff:
-            self.arg_parser.add_argument(
-                "--rail_height",
-                type=float,
-                dest="rail_height",
-                default=10.0,
-                help="Height of rail (float)",
-            )
-            self.arg_parser.add_argument(
-                "--rail_mount_depth",
-                type=float,
-                dest="rail_mount_depth",
-                default=17.4,
-                help="Depth at which to place hole for rail mount bolt (float)",
-            )
-            self.arg_parser.add_argument(
-                "--rail_mount_centre_offset",
-                type=float,
-                dest="rail_mount_centre_offset",
-                default=0.0,
-                help="How far toward row centreline to offset rail mount bolt (from rail centreline) (float)",
-            )
-            self.arg_parser.add_argument(
-                "--rows",
-                type=int,
-                dest="rows",
-                default=0,
-                help="Number of Schroff rows (int)",
-            )
-            self.arg_parser.add_argument(
-                "--hp",
-                type=int,
-                dest="hp",
-                default=0,
-                help="Width (TE/HP units) of Schroff rows (int)",
-            )
-            self.arg_parser.add_argument(
-                "--row_spacing",
-                type=float,
-                dest="row_spacing",
-                default=10.0,
-                help="Height of rail (float)",
-            )
-        else:
-            self.arg_parser.add_argument(
-                "--inside",
-                type=IntBoolean,
-                dest="inside",
-                default=0,
-                help="Int/Ext Dimension",
-                choices=[True, False, '0', '1'],
-            )
-            self.arg_parser.add_argument(
-                "--length",
-                type=float,
-                dest="length",
-                default=100,
-                help="Length of Box (float)",
-            )
-            self.arg_parser.add_argument(
-                "--width",
-                type=float,
-                dest="width",
-                default=100,
-                help="Width of Box (float)",
-            )
-        self.arg_parser.add_argument(
-            "--depth",
-            type=float,
-            dest="height",
-            default=100,
-            help="Height of Box (float)",
-        )
-        self.arg_parser.add_argument(
-            "--tab",
-            type=float,
-            dest="tab",
-            default=5,
-            help="Nominal Tab Width (float)",
-        )
-        self.arg_parser.add_argument(
-            "--equal",
-            type=IntBoolean,
-            dest="equal_tabs",
-            default=False,
-            help="Equal/Prop Tabs",
-            choices=[True, False, '0', '1'],
-        )
-        self.arg_parser.add_argument(
-            "--tabsymmetry",
-            type=int,
-            dest="tabsymmetry",
-            default=0,
-            help="Tab style (0=XY symmetric, 1=Rotationally symmetric, 2=Antisymmetric)",
-            choices=[0, 1, 2],
-        )
-        self.arg_parser.add_argument(
-            "--tabtype",
-            type=IntBoolean,
-            dest="tabtype",
-            default=False,
-            help="Tab type: 0=regular or 1=dogbone",
-            choices=[0, 1],
-        )
-        self.arg_parser.add_argument(
-            "--dimpleheight",
-            type=float,
-            dest="dimpleheight",
-            default=0,
-            help="Tab Dimple Height",
-        )
-        self.arg_parser.add_argument(
-            "--dimplelength",
-            type=float,
-            dest="dimplelength",
-            default=0,
-            help="Tab Dimple Tip Length",
-        )
-        self.arg_parser.add_argument(
-            "--hairline",
-            type=IntBoolean,
-            dest="hairline",
-            default=False,
-            help="Line Thickness (True/False)",
-            choices=[True, False, '0', '1'],
-        )
-        self.arg_parser.add_argument(
-            "--line-thickness",
-            type=float,
-            dest="line_thickness",
-            default=0.1,
-            help="Line Thickness (if not hairline)",
-        )
-        self.arg_parser.add_argument(
-            "--line-color",
-            type=str,
-            dest="color",
-            default="black",
-            help="Line Color",
-            choices=["black", "red", "blue", "green"]
-        )
-        self.arg_parser.add_argument(
-            "--thickness",
-            type=float,
-            dest="thickness",
-            default=5.0,
-            help="Thickness of Material",
-        )
-        self.arg_parser.add_argument(
-            "--kerf",
-            type=float,
-            dest="kerf",
-            default=0,
-            help="Kerf (width of cut)",
-        )
-        self.arg_parser.add_argument(
-            "--style",
-            type=int,
-            dest="style",
-            default=1,
-            help="Layout/Style",
-        )
-        self.arg_parser.add_argument(
-            "--spacing",
-            type=float,
-            dest="spacing",
-            default=3,
-            help="Part Spacing",
-        )
-        self.arg_parser.add_argument(
-            "--boxtype",
-            type=int,
-            dest="boxtype",
-            default=1,
-            help="Box type",
-        )
-        self.arg_parser.add_argument(
-            "--div-l",
-            type=int,
-            dest="div_x",
-            default=0,
-            help="Dividers (Length axis / X axis)",
-        )
-        self.arg_parser.add_argument(
-            "--div-w",
-            type=int,
-            dest="div_y",
-            default=0,
-            help="Dividers (Width axis / Y axis)",
-        )
-        self.arg_parser.add_argument(
-            "--keydiv",
-            type=int,
-            dest="keydiv",
-            default=3,
-            help="Key dividers into walls/floor",
-        )
-        self.arg_parser.add_argument(
-            "--div-l-spacing",
-            type=str,
-            dest="div_x_spacing",
-            default="",
-            help="Custom spacing for X-axis dividers (semicolon separated widths)",
-        )
-        self.arg_parser.add_argument(
-            "--div-w-spacing",
-            type=str,
-            dest="div_y_spacing",
-            default="",
-            help="Custom spacing for Y-axis dividers (semicolon separated widths)",
-        )
-        self.arg_parser.add_argument(
-            "--combine",
-            type=IntBoolean,
-            dest="combine",
-            default=True,
-            help="Combine and clean paths",
-            choices=[True, False, '0', '1'],
-        )
-        self.arg_parser.add_argument(
-            "--cutout",
-            type=IntBoolean,
-            dest="cutout",
-            default=True,
-            help="Cut holes from parent pieces",
-            choices=[True, False, '0', '1'],
-        )
-        self.arg_parser.add_argument(
-            "--dovetail-position",
-            type=str,
-            default=None,
-            help="Where to put dovetail joints",
-            choices=["None", "All", "NoTop"]
-        )
-        self.arg_parser.add_argument(
-            "--dovetail-size",
-            type=float,
-            default=1.5,
-            help="Size of dovetail joints (in thickness units)",
-        )
-        self.arg_parser.add_argument(
-            "--dovetail-angle",
-            type=int,
-            help="Angle of dovetail joints (degrees)",
-            default=50,
-            choices=[30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80]
-        )
-        self.arg_parser.add_argument(
-            "--dovetail-spacing",
-            type=float,
-            default=2.0,
-            help="Spacing of dovetail joints (in thickness units)",
-        )
-        self.arg_parser.add_argument(
-            "--dovetail-offset",
-            type=float,
-            default=1.0,
-            help="Offset of dovetail joints (in thickness units)",
-        )
-        self.arg_parser.add_argument(
-            "--dovetail-male",
-            type=IntBoolean,
-            default=True,
-            help="Whether to use male dovetail joints",
-            choices=[True, False, '0', '1'],
-        )
+        for flag, kwargs in (_SCHROFF_ARGUMENTS if self.schroff else _BOX_ARGUMENTS) + _COMMON_ARGUMENTS:
+            self.arg_parser.add_argument(flag, **kwargs)
 
 
     @staticmethod
@@ -390,7 +458,7 @@ class TabbedBoxMaker(CliEnabledGenerator):
             values = [float(v.strip()) for v in spacing_str.split(';') if v.strip()]
         except ValueError as e:
             inkex.errormsg(f"Error: Invalid divider spacing format: {e}")
-            exit(1)
+            raise BoxMakerValidationError(f"Invalid divider spacing format: {e}") from e
 
         # num_dividers represents the total number of dividers to place
         # values represents the widths of the first N sections (before each specified divider)
@@ -400,8 +468,9 @@ class TabbedBoxMaker(CliEnabledGenerator):
 
         # Validate number of values
         if len(values) > num_sections:
-            inkex.errormsg(f"Error: Too many divider spacing values ({len(values)}) for {num_dividers} dividers (max {num_sections} sections)")
-            exit(1)
+            message = f"Too many divider spacing values ({len(values)}) for {num_dividers} dividers (max {num_sections} sections)"
+            inkex.errormsg(f"Error: {message}")
+            raise BoxMakerValidationError(message)
 
         # Calculate remaining space for auto-sized sections
         used_width = sum(values)
@@ -410,18 +479,21 @@ class TabbedBoxMaker(CliEnabledGenerator):
         if remaining_sections > 0:
             remaining_width = available_width - used_width
             if remaining_width <= 0:
-                inkex.errormsg(f"Error: Specified section widths exceed available space (remaining width {remaining_width:.2f})")
-                exit(1)
+                message = f"Specified section widths exceed available space (remaining width {remaining_width:.2f})"
+                inkex.errormsg(f"Error: {message}")
+                raise BoxMakerValidationError(message)
             auto_width = max(remaining_width / remaining_sections, 0)
             values.extend([auto_width] * remaining_sections)
             used_width += auto_width * remaining_sections
 
         if used_width > available_width:
-            inkex.errormsg(f"Error: Total section widths ({used_width:.2f}) exceed available space ({available_width:.2f})")
-            exit(1)
+            message = f"Total section widths ({used_width:.2f}) exceed available space ({available_width:.2f})"
+            inkex.errormsg(f"Error: {message}")
+            raise BoxMakerValidationError(message)
         elif used_width < available_width:
-            inkex.errormsg(f"Error: Total section widths ({used_width:.2f}) are less than available space ({available_width:.2f})")
-            exit(1)
+            message = f"Total section widths ({used_width:.2f}) are less than available space ({available_width:.2f})"
+            inkex.errormsg(f"Error: {message}")
+            raise BoxMakerValidationError(message)
 
         if reverse:
             values.reverse()
@@ -442,10 +514,12 @@ class TabbedBoxMaker(CliEnabledGenerator):
         if unit == 'document':
             unit = svg.document_unit
 
-        kerf = self.svg.unittouu(str(self.options.kerf) + unit)
+        uu = self.unit_converter(unit)
+
+        kerf = uu(self.options.kerf)
 
         # Set the line thickness
-        line_thickness = self.hairline_thickness if hairline else self.svg.unittouu(str(self.options.line_thickness) + unit)
+        line_thickness = self.hairline_thickness if hairline else uu(self.options.line_thickness)
         if line_thickness == 1.0:
             line_thickness = 1 # Reproduce old output
 
@@ -459,14 +533,14 @@ class TabbedBoxMaker(CliEnabledGenerator):
             # logic
 
             rows = self.options.rows
-            rail_height = self.svg.unittouu(str(self.options.rail_height) + unit)
-            row_centre_spacing = self.svg.unittouu(str(122.5) + unit)
-            row_spacing = self.svg.unittouu(str(self.options.row_spacing) + unit)
-            rail_mount_depth = self.svg.unittouu(str(self.options.rail_mount_depth) + unit)
-            rail_mount_centre_offset = self.svg.unittouu(str(self.options.rail_mount_centre_offset) + unit)
-            rail_mount_radius = self.svg.unittouu(str(2.5) + unit)
-
-            X = self.svg.unittouu(str(self.options.hp * 5.08) + unit)
+            rail_height = uu(self.options.rail_height)
+            row_centre_spacing = uu(122.5)
+            row_spacing = uu(self.options.row_spacing)
+            rail_mount_depth = uu(self.options.rail_mount_depth)
+            rail_mount_centre_offset = uu(self.options.rail_mount_centre_offset)
+            rail_mount_radius = uu(2.5)
+
+            X = uu(self.options.hp * 5.08)
             # 122.5mm vertical distance between mounting hole centres of 3U
             # Schroff panels
             row_height = rows * (row_centre_spacing + rail_height)
@@ -477,8 +551,8 @@ class TabbedBoxMaker(CliEnabledGenerator):
             inside = False
         else:
             # boxmaker.inx
-            X = self.svg.unittouu(str(self.options.length) + unit)
-            Y = self.svg.unittouu(str(self.options.width) + unit)
+            X = uu(self.options.length)
+            Y = uu(self.options.width)
 
             # Default values when not in Schroff mode
             rows = 0
@@ -489,16 +563,16 @@ class TabbedBoxMaker(CliEnabledGenerator):
             rail_mount_radius = 0.0
 
 
-        Z = self.svg.unittouu(str(self.options.height) + unit)
-        thickness = self.svg.unittouu(str(self.options.thickness) + unit)
-        tab_width = self.svg.unittouu(str(self.options.tab) + unit)
+        Z = uu(self.options.height)
+        thickness = uu(self.options.thickness)
+        tab_width = uu(self.options.tab)
         equal_tabs = self.options.equal_tabs
         tabSymmetry = TabSymmetry(self.options.tabsymmetry)
-        dimpleHeight = self.svg.unittouu(str(self.options.dimpleheight) + unit)
-        dimpleLength = self.svg.unittouu(str(self.options.dimplelength) + unit)
+        dimpleHeight = uu(self.options.dimpleheight)
+        dimpleLength = uu(self.options.dimplelength)
         dogbone = self.options.tabtype == 1
         layout = Layout(self.options.style)
-        spacing = self.svg.unittouu(str(self.options.spacing) + unit)
+        spacing = uu(self.options.spacing)
         box_type = BoxType(self.options.boxtype)
         div_x = int(self.options.div_x)
         div_y = int(self.options.div_y)
@@ -509,17 +583,7 @@ class TabbedBoxMaker(CliEnabledGenerator):
         cutout = self.options.cutout
         combine = self.options.combine
 
-        piece_types = [PieceType.Back, PieceType.Left, PieceType.Bottom, PieceType.Right, PieceType.Top, PieceType.Front]
-        if box_type == BoxType.ONE_SIDE_OPEN:
-            piece_types = [PieceType.Bottom, PieceType.Front, PieceType.Back, PieceType.Left, PieceType.Right]
-        elif box_type == BoxType.TWO_SIDES_OPEN:
-            piece_types = [PieceType.Bottom, PieceType.Front, PieceType.Left, PieceType.Right]
-        elif box_type == BoxType.THREE_SIDES_OPEN:
-            piece_types = [PieceType.Bottom,PieceType.Front, PieceType.Left]
-        elif box_type == BoxType.OPPOSITE_ENDS_OPEN:
-            piece_types = [PieceType.Back, PieceType.Left, PieceType.Right, PieceType.Front]
-        elif box_type == BoxType.TWO_PANELS_ONLY:
-            piece_types = [PieceType.Left, PieceType.Bottom]
+        piece_types = list(_PIECE_TYPES_BY_BOXTYPE[box_type])
 
         if inside:  # if inside dimension selected correct values to outside dimension
             inside_X, inside_Y, inside_Z = X, Y, Z
@@ -549,7 +613,7 @@ class TabbedBoxMaker(CliEnabledGenerator):
             schroff=schroff, kerf=kerf, line_thickness=line_thickness, unit=unit, rows=rows,
             rail_height=rail_height, row_spacing=row_spacing, rail_mount_depth=rail_mount_depth,
             rail_mount_centre_offset=rail_mount_centre_offset, rail_mount_radius=rail_mount_radius,
-            cutout=cutout, combine=combine
+            cutout=cutout, combine=combine, coordinate_decimals=self.options.coordinate_decimals
         )
 
     def parse_settings_to_configuration(self, settings: BoxSettings) -> BoxConfiguration:
@@ -560,42 +624,41 @@ class TabbedBoxMaker(CliEnabledGenerator):
         # TODO restrict divisions to logical values
 
         # Validate input values
-        error = False
+        X, Y, Z = settings.X, settings.Y, settings.Z
+        mn = min(X, Y, Z)
+        mx = max(X, Y, Z)
+        thickness = settings.thickness
+        tab_width = settings.tab_width
+        kerf = settings.kerf
+        spacing = settings.spacing
 
+        errors = []
         if settings.unit not in ['mm', 'cm', 'in', 'ft', 'px', 'pt', 'pc']:
-            inkex.errormsg(_("Error: Invalid unit") + f': {settings.unit}')
-            error = True
-        if min(settings.X, settings.Y, settings.Z) == 0:
-            inkex.errormsg(_("Error: Dimensions must be non zero")+ f': ({settings.X}, {settings.Y}, {settings.Z})')
-            error = True
-        if min(settings.X, settings.Y, settings.Z) < 3 * settings.tab_width:
-            inkex.errormsg(_("Error: Tab size too large") + f': ({3 * settings.tab_width} > {min(settings.X, settings.Y, settings.Z)})')
-            error = True
-        if settings.tab_width < settings.thickness:
-            inkex.errormsg(_("Error: Tab size too small") + f': ({settings.tab_width} < {settings.thickness})')
-            error = True
-        if settings.thickness == 0:
-            inkex.errormsg(_("Error: thickness is zero"))
-            error = True
-        if settings.thickness > min(settings.X, settings.Y, settings.Z) / 3:  # crude test
-            inkex.errormsg(_("Error: Material too thick"))
-            error = True
-        if settings.kerf > min(settings.X, settings.Y, settings.Z) / 3:  # crude test
-            inkex.errormsg(_("Error: kerf too large")+ f': ({settings.kerf} > {min(settings.X, settings.Y, settings.Z) / 3})')
-            error = True
-        if settings.spacing > max(settings.X, settings.Y, settings.Z) * 10:  # crude test
-            inkex.errormsg(_("Error: Spacing too large") + f': ({settings.spacing} > {max(settings.X, settings.Y, settings.Z) * 10})')
-            error = True
-        if settings.spacing < settings.kerf:
-            inkex.errormsg(_("Error: Spacing too small") + f': ({settings.spacing} < {settings.kerf})')
-            error = True
+            errors.append(_("Error: Invalid unit") + f': {settings.unit}')
+        if mn == 0:
+            errors.append(_("Error: Dimensions must be non zero") + f': ({X}, {Y}, {Z})')
+        if mn < 3 * tab_width:
+            errors.append(_("Error: Tab size too large") + f': ({3 * tab_width} > {mn})')
+        if tab_width < thickness:
+            errors.append(_("Error: Tab size too small") + f': ({tab_width} < {thickness})')
+        if thickness == 0:
+            errors.append(_("Error: thickness is zero"))
+        if thickness > mn / 3:  # crude test
+            errors.append(_("Error: Material too thick"))
+        if kerf > mn / 3:  # crude test
+            errors.append(_("Error: kerf too large") + f': ({kerf} > {mn / 3})')
+        if spacing > mx * 10:  # crude test
+            errors.append(_("Error: Spacing too large") + f': ({spacing} > {mx * 10})')
+        if spacing < kerf:
+            errors.append(_("Error: Spacing too small") + f': ({spacing} < {kerf})')
         if settings.line_color not in ['black', 'red', 'blue', 'green']:
-            inkex.errormsg(_("Error: Invalid line color") + f': {settings.line_color}')
-            error = True
+            errors.append(_("Error: Invalid line color") + f': {settings.line_color}')
 
-        if error:
+        if errors:
+            for message in errors:
+                inkex.errormsg(message)
             inkex.errormsg(f'Provided arguments: {self.cli_args}')
-            exit(1)
+            raise BoxMakerValidationError("; ".join(errors))
 
         # Handle Schroff settings if needed
         schroff_settings = None
@@ -603,7 +666,7 @@ class TabbedBoxMaker(CliEnabledGenerator):
             schroff_settings = SchroffSettings(
                 rows=settings.rows,
                 rail_height=settings.rail_height,
-                row_centre_spacing=self.svg.unittouu(str(122.5) + settings.unit),
+                row_centre_spacing=self.unit_converter(settings.unit)(122.5),
                 row_spacing=settings.row_spacing,
                 rail_mount_depth=settings.rail_mount_depth,
                 rail_mount_centre_offset=settings.rail_mount_centre_offset,
@@ -620,75 +683,18 @@ class TabbedBoxMaker(CliEnabledGenerator):
         """Create the tab configuration based on box settings"""
 
         # Determine where the tabs go based on the tab style
-        if settings.tab_symmetry == TabSymmetry.ANTISYMMETRIC:  # deprecated
-            tpTabInfo = 0b0110
-            bmTabInfo = 0b1100
-            ltTabInfo = 0b1100
-            rtTabInfo = 0b0110
-            ftTabInfo = 0b1100
-            bkTabInfo = 0b1001
-        elif settings.tab_symmetry == TabSymmetry.ROTATE_SYMMETRIC:  # Rotationally symmetric (Waffle-blocks)
-            tpTabInfo = 0b1111
-            bmTabInfo = 0b1111
-            ltTabInfo = 0b1111
-            rtTabInfo = 0b1111
-            ftTabInfo = 0b1111
-            bkTabInfo = 0b1111
-        else:  # XY symmetric
-            tpTabInfo = 0b0000
-            bmTabInfo = 0b0000
-            ltTabInfo = 0b1111
-            rtTabInfo = 0b1111
-            ftTabInfo = 0b1010
-            bkTabInfo = 0b1010
-
-        def fixTabBits(tabbed : bool, bit : int) -> tuple[bool, int]:
-            newTabbed = tabbed & ~bit
-            return newTabbed
+        (tpTabInfo, bmTabInfo, ltTabInfo,
+         rtTabInfo, ftTabInfo, bkTabInfo) = _TAB_INFO_BY_SYMMETRY[settings.tab_symmetry]
 
         # Update the tab bits based on which sides of the box don't exist
-        tpTabbed = bmTabbed = ltTabbed = rtTabbed = ftTabbed = bkTabbed = 0b1111
-        if PieceType.Top not in pieceTypes:
-            bkTabbed = fixTabBits(bkTabbed, 0b0010)
-            ftTabbed = fixTabBits(ftTabbed, 0b1000)
-            ltTabbed = fixTabBits(ltTabbed, 0b0001)
-            rtTabbed = fixTabBits(rtTabbed, 0b0100)
-            tpTabbed = 0
-        if PieceType.Bottom not in pieceTypes:
-            bkTabbed = fixTabBits(bkTabbed, 0b1000)
-            ftTabbed = fixTabBits(ftTabbed, 0b0010)
-            ltTabbed = fixTabBits(ltTabbed, 0b0100)
-            rtTabbed = fixTabBits(rtTabbed, 0b0001)
-            bmTabbed = 0
-        if PieceType.Front not in pieceTypes:
-            tpTabbed = fixTabBits(tpTabbed, 0b1000)
-            bmTabbed = fixTabBits(bmTabbed, 0b1000)
-            ltTabbed = fixTabBits(ltTabbed, 0b1000)
-            rtTabbed = fixTabBits(rtTabbed, 0b1000)
-            ftTabbed = 0
-        if PieceType.Back not in pieceTypes:
-            tpTabbed = fixTabBits(tpTabbed, 0b0010)
-            bmTabbed = fixTabBits(bmTabbed, 0b0010)
-            ltTabbed = fixTabBits(ltTabbed, 0b0010)
-            rtTabbed = fixTabBits(rtTabbed, 0b0010)
-            bkTabbed = 0
-        if PieceType.Left not in pieceTypes:
-            tpTabbed = fixTabBits(tpTabbed, 0b0100)
-            bmTabbed = fixTabBits(bmTabbed, 0b0001)
-            bkTabbed = fixTabBits(bkTabbed, 0b0001)
-            ftTabbed = fixTabBits(ftTabbed, 0b0001)
-            ltTabbed = 0
-        if PieceType.Right not in pieceTypes:
-            tpTabbed = fixTabBits(tpTabbed, 0b0001)
-            bmTabbed = fixTabBits(bmTabbed, 0b0100)
-            bkTabbed = fixTabBits(bkTabbed, 0b0100)
-            ftTabbed = fixTabBits(ftTabbed, 0b0100)
-            rtTabbed = 0
+        tabbed = _tabbed_bits(frozenset(pieceTypes))
 
         return TabConfiguration(
             tpTabInfo=tpTabInfo, bmTabInfo=bmTabInfo, ltTabInfo=ltTabInfo, rtTabInfo=rtTabInfo,
-            ftTabInfo=ftTabInfo, bkTabInfo=bkTabInfo, tpTabbed=tpTabbed, bmTabbed=bmTabbed,
-            ltTabbed=ltTabbed, rtTabbed=rtTabbed, ftTabbed=ftTabbed, bkTabbed=bkTabbed
+            ftTabInfo=ftTabInfo, bkTabInfo=bkTabInfo,
+            tpTabbed=tabbed[PieceType.Top], bmTabbed=tabbed[PieceType.Bottom],
+            ltTabbed=tabbed[PieceType.Left], rtTabbed=tabbed[PieceType.Right],
+            ftTabbed=tabbed[PieceType.Front], bkTabbed=tabbed[PieceType.Back]
         )
 
 
@@ -696,13 +702,10 @@ class TabbedBoxMaker(CliEnabledGenerator):
     def apply_layout(created_pieces : list[Piece], settings: BoxSettings) -> list[Piece]:
         """Apply the selected layout to position the pieces"""
 
-
-        def get_pieces(ptype: PieceType) -> list[Piece]:
-            return [p for p in created_pieces if p.pieceType == ptype]
-
         piece_types = settings.piece_types
 
-        # Layout positions are specified in a grid of rows and columns
+        # Layout positions are specified in a grid of rows and columns. The
+        # tuples are immutable, so each layout takes plain list copies.
         row0 = (1, 0, 0, 0)  # top row
         row1y = (2, 0, 1, 0)  # second row, offset by Y
         row1z = (2, 0, 0, 1)  # second row, offset by Z
@@ -730,14 +733,22 @@ class TabbedBoxMaker(CliEnabledGenerator):
         # pieceType: 1=XY, 2=XZ, 3=ZY
 
         def reduceOffsets(aa : list, start : int, dx : int, dy : int, dz : int):
-            for ix in range(start + 1, len(aa)):
-                (s, x, y, z) = aa[ix]
-                aa[ix] = (s - 1, x - dx, y - dy, z - dz)
+            aa[start + 1:] = [(s - 1, x - dx, y - dy, z - dz) for (s, x, y, z) in aa[start + 1:]]
 
-        # note first two pieces in each set are the X-divider template and
-        # Y-divider template respectively
-        pieces_list : list[Piece] = []
-        if settings.layout == Layout.DIAGRAMMATIC:  # Diagramatic Layout
+        X, Y, Z = settings.X, settings.Y, settings.Z
+
+        # Position pieces using original coordinate calculation
+        def calculate_position(col_tuple, row_tuple) -> Vec:
+            # Formula: x = xs * spacing + xx * X + xy * Y + xz * Z + initOffsetX
+            # col_tuple = (xs, xx, xy, xz), row_tuple = (ys, yx, yy, yz)
+            xs, xx, xy, xz = col_tuple
+            ys, yx, yy, yz = row_tuple
+
+            return Vec(xs * spacing + xx * X + xy * Y + xz * Z + initOffsetX,
+                       ys * spacing + yx * X + yy * Y + yz * Z + initOffsetY)
+
+        layout = settings.layout
+        if layout == Layout.DIAGRAMMATIC:  # Diagramatic Layout
             rr = [row0, row1z, row2]
             cc = [col0, col1z, col2xz, col3xzz]
             if PieceType.Front not in piece_types:
@@ -746,143 +757,14 @@ class TabbedBoxMaker(CliEnabledGenerator):
                 reduceOffsets(cc, 0, 0, 0, 1)
             if PieceType.Right not in piece_types:
                 reduceOffsets(cc, 2, 0, 0, 1)
-
-            # Position pieces using original coordinate calculation
-            def calculate_position(col_tuple, row_tuple) -> Vec:
-                # Formula: x = xs * spacing + xx * X + xy * Y + xz * Z + initOffsetX
-                # col_tuple = (xs, xx, xy, xz), row_tuple = (ys, yx, yy, yz)
-                xs, xx, xy, xz = col_tuple
-                ys, yx, yy, yz = row_tuple
-
-                x = xs * spacing + xx * settings.X + xy * settings.Y + xz * settings.Z + initOffsetX
-                y = ys * spacing + yx * settings.X + yy * settings.Y + yz * settings.Z + initOffsetY
-
-                return Vec(x, y)
-
-            for piece in get_pieces(PieceType.Back):
-                piece.base = calculate_position(cc[1], rr[2])  # cc[1], rr[2] - Back piece
-                pieces_list.append(piece)
-
-            # Add X dividers after Back piece (as in original)
-            divider_x_pos = calculate_position(cc[1], rr[2])  # cc[1], rr[2] - Back piece
-            if PieceType.Back in piece_types:
-                divider_x_pos += Vec(0, settings.Z + spacing)
-            if not settings.keydiv_walls:
-                divider_x_pos += Vec(settings.thickness, 0)
-            for divider in get_pieces(PieceType.XDivider):
-                divider.base = divider_x_pos
-                divider_x_pos += Vec(0, spacing + divider.dy)
-                pieces_list.append(divider)
-
-            for piece in get_pieces(PieceType.Left):
-                piece.base = calculate_position(cc[0], rr[1])  # cc[0], rr[1] - Left piece
-                pieces_list.append(piece)
-
-
-            divider_y_pos = calculate_position(cc[3], rr[1])  # cc[3], rr[1] - Top piece
-            if PieceType.Top in piece_types:
-                divider_y_pos += Vec(settings.X + spacing, 0)
-            if not settings.keydiv_walls:
-                divider_y_pos += Vec(0, settings.thickness)
-            # Add Y dividers after Left piece (as in original)
-            for divider in get_pieces(PieceType.YDivider):
-                divider.base = divider_y_pos
-                divider_y_pos += Vec(spacing + divider.dx, 0)
-                pieces_list.append(divider)
-
-            for piece in get_pieces(PieceType.Bottom):
-                piece.base = calculate_position(cc[1], rr[1])  # cc[1], rr[1] - Bottom piece
-                pieces_list.append(piece)
-
-            for piece in get_pieces(PieceType.Right):
-                piece.base = calculate_position(cc[2], rr[1])  # cc[2], rr[1] - Right piece
-                pieces_list.append(piece)
-
-            for piece in get_pieces(PieceType.Top):
-                piece.base = calculate_position(cc[3], rr[1])  # cc[3], rr[1] - Top piece
-                pieces_list.append(piece)
-
-            for piece in get_pieces(PieceType.Front):
-                piece.base = calculate_position(cc[1], rr[0])  # cc[1], rr[0] - Front piece
-                pieces_list.append(piece)
-        elif settings.layout == Layout.THREE_PIECE:  # 3 Piece Layout - compact vertical layout
-            # THREE_PIECE layout uses coordinate tuples to calculate positions
-            # Original coordinate tuple definitions:
-            row0 = (1, 0, 0, 0)  # top row
-            row1y = (2, 0, 1, 0)  # second row, offset by Y
-            row2 = (3, 0, 1, 1)  # third row, always offset by Y+Z
-
-            col0 = (1, 0, 0, 0)  # left column
-            col1z = (2, 0, 0, 1)  # second column, offset by Z
-
+        elif layout == Layout.THREE_PIECE:  # 3 Piece Layout - compact vertical layout
             rr = [row0, row1y, row2]
             cc = [col0, col1z]
-
-            # Position pieces using original coordinate calculation
-            def calculate_position(col_tuple, row_tuple) -> Vec:
-                # Formula: x = xs * spacing + xx * X + xy * Y + xz * Z + initOffsetX
-                # col_tuple = (xs, xx, xy, xz), row_tuple = (ys, yx, yy, yz)
-                xs, xx, xy, xz = col_tuple
-                ys, yx, yy, yz = row_tuple
-
-                x = xs * spacing + xx * settings.X + xy * settings.Y + xz * settings.Z + initOffsetX
-                y = ys * spacing + yx * settings.X + yy * settings.Y + yz * settings.Z + initOffsetY
-
-                return Vec(x, y)
-
-            # Separate pieces by type for proper ordering
-            for piece in get_pieces(PieceType.Back):
-                piece.base = calculate_position(cc[1], rr[1])  # cc[1], rr[1] - Back piece
-                pieces_list.append(piece)
-
-
-            # Add X dividers after Back piece (as in original)
-            for idx, divider in enumerate(get_pieces(PieceType.XDivider)):
-                # Original divider positioning: divider_y = 4 * spacing + 1 * Y + 2 * Z
-                divider_y = 4 * spacing + 1 * settings.Y + 2 * settings.Z
-                divider_x = idx * (spacing + settings.X) + spacing
-                divider.base = Vec(divider_x, divider_y)
-                pieces_list.append(divider)
-
-            for piece in get_pieces(PieceType.Left):
-                piece.base = calculate_position(cc[0], rr[0])  # cc[0], rr[0] - Left piece
-                pieces_list.append(piece)
-
-            # Add Y dividers after Left piece (as in original)
-            for idx, divider in enumerate(get_pieces(PieceType.YDivider)):
-                # Original divider positioning: divider_y = 5 * spacing + 1 * Y + 3 * Z
-                divider_y = 5 * spacing + 1 * settings.Y + 3 * settings.Z
-                divider_x = idx * (spacing + settings.Z) + spacing
-                divider.base = Vec(divider_x, divider_y)
-                pieces_list.append(divider)
-
-            for piece in get_pieces(PieceType.Bottom):
-                piece.base = calculate_position(cc[1], rr[0])  # cc[1], rr[0] - Bottom piece
-                pieces_list.append(piece)
-
-        elif settings.layout == Layout.INLINE_COMPACT:  # Inline(compact) Layout
-            # INLINE_COMPACT layout uses coordinate tuples to calculate positions
-            # Original coordinate tuple definitions:
-            row0 = (1, 0, 0, 0)  # top row
-            row1y = (2, 0, 1, 0)  # second row, offset by Y
-            row2 = (3, 0, 1, 1)  # third row, always offset by Y+Z
-
-            col0 = (1, 0, 0, 0)  # left column
-            col1x = (2, 1, 0, 0)  # second column, offset by X
-            col2xx = (3, 2, 0, 0)  # third column, offset by 2*X
-            col3xxz = (4, 2, 0, 1)  # fourth column, offset by 2*X+Z
-            col4 = (5, 2, 0, 2)  # fifth column, always offset by 2*X+2*Z
-            col5 = (6, 3, 0, 2)  # sixth column, always offset by 3*X+2*Z
-
+        elif layout == Layout.INLINE_COMPACT:  # Inline(compact) Layout
             rr = [row0, row1y, row2]
             cc = [col0, col1x, col2xx, col3xxz, col4, col5]
 
             # Apply reductions based on missing pieces (from original code)
-            def reduceOffsets(aa, start, dx, dy, dz):
-                for ix in range(start + 1, len(aa)):
-                    (s, x, y, z) = aa[ix]
-                    aa[ix] = (s - 1, x - dx, y - dy, z - dz)
-
             if PieceType.Top not in piece_types:
                 # remove col0, shift others left by X
                 reduceOffsets(cc, 0, 1, 0, 0)
@@ -894,58 +776,73 @@ class TabbedBoxMaker(CliEnabledGenerator):
                 reduceOffsets(cc, 3, 0, 0, 1)
             if PieceType.Back not in piece_types:
                 reduceOffsets(cc, 4, 1, 0, 0)
+        else:
+            return []
 
-            # Position pieces using original coordinate calculation
-            def calculate_position(col_tuple, row_tuple) -> Vec:
-                # Formula: x = xs * spacing + xx * X + xy * Y + xz * Z + initOffsetX
-                # col_tuple = (xs, xx, xy, xz), row_tuple = (ys, yx, yy, yz)
-                xs, xx, xy, xz = col_tuple
-                ys, yx, yy, yz = row_tuple
-
-                x = xs * spacing + xx * settings.X + xy * settings.Y + xz * settings.Z + initOffsetX
-                y = ys * spacing + yx * settings.X + yy * settings.Y + yz * settings.Z + initOffsetY
-
-                return Vec(x, y)
-
+        pieces_by_type: dict[PieceType, list[Piece]] = {}
+        for piece in created_pieces:
+            pieces_by_type.setdefault(piece.pieceType, []).append(piece)
 
-            # Follow exact original INLINE_COMPACT order: Back -> X dividers -> Left -> Y dividers -> Top -> Bottom -> Right -> Front
-            for piece in get_pieces(PieceType.Back):
-                piece.base = calculate_position(cc[4], rr[0])  # cc[4], rr[0] - Back piece
-                pieces_list.append(piece)
+        cells = _LAYOUT_CELLS[layout]
+        pieces_list : list[Piece] = []
 
-            # Add X dividers after Back piece (as in original)
-            for idx, divider in enumerate(get_pieces(PieceType.XDivider)):
-                divider_y = 4 * spacing + 1 * settings.Y + 2 * settings.Z
-                divider_x = idx * (spacing + settings.X) + spacing
-                divider.base = Vec(divider_x, divider_y)
+        def place_faces(*pieceTypes: PieceType) -> None:
+            for pieceType in pieceTypes:
+                col, row = cells[pieceType]
+                for piece in pieces_by_type.get(pieceType, ()):
+                    piece.base = calculate_position(cc[col], rr[row])
+                    pieces_list.append(piece)
+
+        # Order: Back -> X dividers -> Left -> Y dividers -> remaining faces
+        place_faces(PieceType.Back)
+
+        # Add X dividers after Back piece (as in original)
+        x_dividers = pieces_by_type.get(PieceType.XDivider, ())
+        if layout == Layout.DIAGRAMMATIC:
+            col, row = cells[PieceType.Back]
+            divider_x_pos = calculate_position(cc[col], rr[row])
+            if PieceType.Back in piece_types:
+                divider_x_pos += Vec(0, settings.Z + spacing)
+            if not settings.keydiv_walls:
+                divider_x_pos += Vec(settings.thickness, 0)
+            for divider in x_dividers:
+                divider.base = divider_x_pos
+                divider_x_pos += Vec(0, spacing + divider.dy)
                 pieces_list.append(divider)
-
-            for piece in get_pieces(PieceType.Left):
-                piece.base = calculate_position(cc[2], rr[0])  # cc[2], rr[0] - Left piece
-                pieces_list.append(piece)
-
-            # Add Y dividers after Left piece (as in original)
-            for idx, divider in enumerate(get_pieces(PieceType.YDivider)):
-                divider_y = 5 * spacing + 1 * settings.Y + 3 * settings.Z
-                divider_x = idx * (spacing + settings.Z)
-                divider.base = Vec(divider_x, divider_y)
+        else:
+            # Original divider positioning: divider_y = 4 * spacing + 1 * Y + 2 * Z
+            divider_y = 4 * spacing + 1 * settings.Y + 2 * settings.Z
+            divider_step = spacing + settings.X
+            for idx, divider in enumerate(x_dividers):
+                divider.base = Vec(idx * divider_step + spacing, divider_y)
                 pieces_list.append(divider)
 
-            for piece in get_pieces(PieceType.Top):
-                piece.base = calculate_position(cc[0], rr[0])  # cc[0], rr[0] - Top piece
-                pieces_list.append(piece)
-
-            for piece in get_pieces(PieceType.Bottom):
-                piece.base = calculate_position(cc[1], rr[0])  # cc[1], rr[0] - Bottom piece
-                pieces_list.append(piece)
+        place_faces(PieceType.Left)
 
-            for piece in get_pieces(PieceType.Right):
-                piece.base = calculate_position(cc[3], rr[0])  # cc[3], rr[0] - Right piece
-                pieces_list.append(piece)
+        # Add Y dividers after Left piece (as in original)
+        y_dividers = pieces_by_type.get(PieceType.YDivider, ())
+        if layout == Layout.DIAGRAMMATIC:
+            col, row = cells[PieceType.Top]
+            divider_y_pos = calculate_position(cc[col], rr[row])
+            if PieceType.Top in piece_types:
+                divider_y_pos += Vec(settings.X + spacing, 0)
+            if not settings.keydiv_walls:
+                divider_y_pos += Vec(0, settings.thickness)
+            for divider in y_dividers:
+                divider.base = divider_y_pos
+                divider_y_pos += Vec(spacing + divider.dx, 0)
+                pieces_list.append(divider)
+        else:
+            # The three piece layout keeps a leading spacing, inline does not
+            leading = spacing if layout == Layout.THREE_PIECE else 0
+            # Original divider positioning: divider_y = 5 * spacing + 1 * Y + 3 * Z
+            divider_y = 5 * spacing + 1 * settings.Y + 3 * settings.Z
+            divider_step = spacing + settings.Z
+            for idx, divider in enumerate(y_dividers):
+                divider.base = Vec(idx * divider_step + leading, divider_y)
+                pieces_list.append(divider)
 
-            for piece in get_pieces(PieceType.Front):
-                piece.base = calculate_position(cc[5], rr[0])  # cc[5], rr[0] - Front piece
-                pieces_list.append(piece)
+        place_faces(*(t for t in cells if t not in (PieceType.Back, PieceType.Left)))
 
         return pieces_list
 
@@ -1013,12 +910,14 @@ class TabbedBoxMaker(CliEnabledGenerator):
                 horizontal_spacing = []
                 vertical_spacing = []
 
-            # Sides: A=top, B=right, C=bottom, D=left
+            # Sides: A=top, B=right, C=bottom, D=left; tab bits are <abcd>,
+            # so side n uses bit (3 - n) and A/C run along dx, B/D along dy
+            inside_lengths = (inside_dx, inside_dy)
+            is_male = _TAB_BITS[tabInfo]
+            has_tabs = _TAB_BITS[tabbed]
             sides = [
-                Side(settings, Sides.A, bool(tabInfo & 0b1000), bool(tabbed & 0b1000), inside_dx, pieceType),
-                Side(settings, Sides.B, bool(tabInfo & 0b0100), bool(tabbed & 0b0100), inside_dy, pieceType),
-                Side(settings, Sides.C, bool(tabInfo & 0b0010), bool(tabbed & 0b0010), inside_dx, pieceType),
-                Side(settings, Sides.D, bool(tabInfo & 0b0001), bool(tabbed & 0b0001), inside_dy, pieceType)
+                Side(settings, name, is_male[name], has_tabs[name], inside_lengths[name & 1], pieceType)
+                for name in Sides
             ]
 
             # Assign divider spacings to appropriate sides
@@ -1029,17 +928,18 @@ class TabbedBoxMaker(CliEnabledGenerator):
 
 
             if pieceType not in [PieceType.XDivider, PieceType.YDivider]:
-                # Already extracted above from Side objects
-                wall = pieceType not in [PieceType.Top, PieceType.Bottom]
+                # Top and bottom key the dividers when keydiv_floor is set,
+                # the walls when keydiv_walls is set
                 floor = pieceType in [PieceType.Bottom, PieceType.Top]
 
-                if pieceType not in [PieceType.Front, PieceType.Back] and (settings.keydiv_floor or wall) and (settings.keydiv_walls or floor):
-                    if sides[Sides.A].has_tabs or sides[Sides.C].has_tabs:
-                        sides[Sides.A].num_dividers = settings.div_x
+                if settings.keydiv_floor if floor else settings.keydiv_walls:
+                    if pieceType not in [PieceType.Front, PieceType.Back]:
+                        if sides[Sides.A].has_tabs or sides[Sides.C].has_tabs:
+                            sides[Sides.A].num_dividers = settings.div_x
 
-                if pieceType not in [PieceType.Left, PieceType.Right] and ((settings.keydiv_floor or wall) and (settings.keydiv_walls or floor)):
-                    if sides[Sides.B].has_tabs or sides[Sides.D].has_tabs:
-                        sides[Sides.B].num_dividers = settings.div_y
+                    if pieceType not in [PieceType.Left, PieceType.Right]:
+                        if sides[Sides.B].has_tabs or sides[Sides.D].has_tabs:
+                            sides[Sides.B].num_dividers = settings.div_y
 
             return sides
 
@@ -1071,97 +971,101 @@ class TabbedBoxMaker(CliEnabledGenerator):
             pieces.append(Piece(sides, PieceType.Front))
 
         # Create dividers using piece-driven approach
+        # All dividers of a kind are identical, so build one and copy it
         if settings.div_x > 0:
-            for n in range(int(settings.div_x)):
-                sides = make_sides(settings, tabs, PieceType.XDivider)
+            sides = make_sides(settings, tabs, PieceType.XDivider)
 
-                # Remove tabs from dividers if not required
-                if not settings.keydiv_floor:
-                    sides[0].has_tabs = sides[2].has_tabs = False # sides A and C
-                if not settings.keydiv_walls:
-                    sides[1].has_tabs = sides[3].has_tabs = False # sides B and D
+            # Remove tabs from dividers if not required
+            if not settings.keydiv_floor:
+                sides[0].has_tabs = sides[2].has_tabs = False # sides A and C
+            if not settings.keydiv_walls:
+                sides[1].has_tabs = sides[3].has_tabs = False # sides B and D
 
-                sides[1].num_dividers = sides[3].num_dividers = settings.div_y
-                piece = Piece(sides, PieceType.XDivider)
+            sides[1].num_dividers = sides[3].num_dividers = settings.div_y
+            piece = Piece(sides, PieceType.XDivider)
 
-                pieces.append(piece)
+            pieces.append(piece)
+            pieces.extend(piece.copy() for n in range(1, int(settings.div_x)))
 
         if settings.div_y > 0:
-            for n in range(int(settings.div_y)):
-                sides = make_sides(settings, tabs, PieceType.YDivider)
+            sides = make_sides(settings, tabs, PieceType.YDivider)
 
-                # Remove tabs from dividers if not required
-                if not settings.keydiv_walls:
-                    sides[0].has_tabs = sides[2].has_tabs = False # sides A and C
-                if not settings.keydiv_floor:
-                    sides[1].has_tabs = sides[3].has_tabs = False # sides B and D
+            # Remove tabs from dividers if not required
+            if not settings.keydiv_walls:
+                sides[0].has_tabs = sides[2].has_tabs = False # sides A and C
+            if not settings.keydiv_floor:
+                sides[1].has_tabs = sides[3].has_tabs = False # sides B and D
 
-                sides[0].num_dividers = sides[2].num_dividers = settings.div_x
-                piece = Piece(sides, PieceType.YDivider)
-                pieces.append(piece)
+            sides[0].num_dividers = sides[2].num_dividers = settings.div_x
+            piece = Piece(sides, PieceType.YDivider)
+            pieces.append(piece)
+            pieces.extend(piece.copy() for n in range(1, int(settings.div_y)))
 
         return pieces
 
     def generate_pieces(self, pieces: list[Piece], config: BoxConfiguration, settings: BoxSettings):
         """Generate and draw all pieces based on the configuration"""
 
+        thickness = settings.thickness
+        schroff = config.schroff_settings if settings.schroff else None
+        optimize = settings.cutout or settings.combine
+        makeGroup = self.makeGroup
+        render_side = self.render_side
+
         for piece in pieces:  # generate and draw each piece of the box
             pieceType = piece.pieceType
 
-            group = self.makeGroup(pieceType.name.lower())
+            group = makeGroup(pieceType.name.lower())
 
-            if settings.schroff and pieceType in [PieceType.Left, PieceType.Right] and config.schroff_settings:
+            if schroff and pieceType in (PieceType.Left, PieceType.Right):
                 aSide, bSide, cSide, dSide = piece.sides
                 (x, y) = piece.base
-
-                schroff = config.schroff_settings
                 dx = piece.dx
                 dy = piece.dy
 
-                log(f"rail holes enabled on piece at ({x + settings.thickness}, {y + settings.thickness})")
-                log(f"abcd = ({aSide.has_tabs and aSide.is_male},{bSide.has_tabs and bSide.is_male},{cSide.has_tabs and cSide.is_male},{dSide.has_tabs and dSide.is_male})")
-                log(f"dxdy = ({dx},{dy})")
-                rhxoffset = schroff.rail_mount_depth + settings.thickness
+                if _LOG_ENABLED:
+                    log(f"rail holes enabled on piece at ({x + thickness}, {y + thickness})")
+                    log(f"abcd = ({aSide.has_tabs and aSide.is_male},{bSide.has_tabs and bSide.is_male},{cSide.has_tabs and cSide.is_male},{dSide.has_tabs and dSide.is_male})")
+                    log(f"dxdy = ({dx},{dy})")
+                rhxoffset = schroff.rail_mount_depth + thickness
                 if piece.pieceType == PieceType.Left:
                     rhx = x + rhxoffset
                 elif piece.pieceType == PieceType.Right:
                     rhx = x - rhxoffset + dx
                 else:
                     rhx = 0
-                log("rhxoffset = %d, rhx= %d" % (rhxoffset, rhx))
-                rystart = y + (settings.schroff.rail_height / 2) + settings.thickness
+                log("rhxoffset = %d, rhx= %d", rhxoffset, rhx)
+                rystart = y + (schroff.rail_height / 2) + thickness
+                radius = schroff.rail_mount_radius
+                centreOffset = schroff.rail_mount_centre_offset
                 if settings.rows == 1:
-                    log("just one row this time, rystart = %d" % rystart)
-                    rh1y = rystart + settings.schroff.rail_mount_centre_offset
-                    rh2y = rh1y + (settings.schroff.row_centre_spacing - settings.schroff.rail_mount_centre_offset)
-                    group.add(
-                        self.makeCircle(
-                            settings.schroff.rail_mount_radius, (rhx, rh1y)))
-                    group.add(
-                        self.makeCircle(
-                            settings.schroff.rail_mount_radius, (rhx, rh2y)))
+                    log("just one row this time, rystart = %d", rystart)
+                    rh1y = rystart + centreOffset
+                    holeYs = [rh1y, rh1y + (schroff.row_centre_spacing - centreOffset)]
                 else:
+                    rowCentreSpacing = schroff.row_centre_spacing
+                    rowStep = schroff.row_centre_spacing + schroff.row_spacing + schroff.rail_height
+                    holeYs = []
                     for n in range(0, schroff.rows):
-                        log(f"drawing row {n + 1}, rystart = {rystart}")
+                        if _LOG_ENABLED:
+                            log(f"drawing row {n + 1}, rystart = {rystart}")
                         # if holes are offset (eg. Vector T-strut rails), they should be offset
                         # toward each other, ie. toward the centreline of the
                         # Schroff row
-                        rh1y = rystart + settings.schroff.rail_mount_centre_offset
-                        rh2y = rh1y + settings.schroff.row_centre_spacing - settings.schroff.rail_mount_centre_offset
-                        group.add(
-                            self.makeCircle(
-                                settings.schroff.rail_mount_radius, (rhx, rh1y)))
-                        group.add(
-                            self.makeCircle(
-                                settings.schroff.rail_mount_radius, (rhx, rh2y)))
-                        rystart += settings.schroff.row_centre_spacing + settings.schroff.row_spacing + settings.schroff.rail_height
+                        rh1y = rystart + centreOffset
+                        holeYs += (rh1y, rh1y + rowCentreSpacing - centreOffset)
+                        rystart += rowStep
+                group.extend([self.makeCircle(radius, (rhx, rhy)) for rhy in holeYs])
 
             # generate and draw the sides of each piece
             for side in piece.sides:
-                self.render_side(group, piece, side, settings)
+                render_side(group, piece, side, settings)
+
+            if settings.coordinate_decimals is not None:
+                round_paths(group, settings.coordinate_decimals)
 
             # All pieces drawn, now optimize the paths if required
-            if settings.cutout or settings.combine:
+            if optimize:
                 self.optimizePiece(group, settings)
 
             # Last step: If the group now just contains one path, remove
@@ -1216,10 +1120,8 @@ class TabbedBoxMaker(CliEnabledGenerator):
         paths = [child for child in group if isinstance(child, PathElement)]
 
         if settings.combine:
+            # Drops the attached paths from the list as well
             try_attach_paths(paths, reverse=True)
-            paths = [child for child in group if isinstance(child, PathElement)]
-
-        if settings.combine:
             try_clean_paths(paths)
 
         # Step 3: Include gaps in the panel outline by removing them from the panel path
@@ -1227,17 +1129,22 @@ class TabbedBoxMaker(CliEnabledGenerator):
             try_combine_paths(paths, inkscape=self.inkscape, no_subtract=self.no_subtract, force_interiors=hasattr(self, 'force_interiors') and self.force_interiors)
 
     @staticmethod
-    def dimpleStr(
+    @lru_cache(maxsize=128)
+    def dimpleSteps(
         tabVector: float,
-        vector: Vec,
         direction: Vec,
         toInside: Vec,
         ddir: int,
         isMale: bool,
         dimpleLength: float,
         dimpleHeight: float
-    ) -> Path:
-        ds = Path()
+    ) -> tuple[Vec, ...]:
+        """Return the successive offsets of the dimple points along a tab edge,
+        the first one relative to the start of the edge.
+
+        Sides with the same direction and tab settings share their offsets,
+        so recent results are cached; the bounded size keeps batch runs over
+        many box sizes from growing the cache forever."""
         if not isMale:
             ddir = -ddir
         if dimpleHeight > 0 and tabVector != 0:
@@ -1247,15 +1154,13 @@ class TabbedBoxMaker(CliEnabledGenerator):
             else:
                 dimpleStart = (tabVector + dimpleLength) / 2 + dimpleHeight
                 tabSign = -1
-            Vd = vector + toInside * dimpleStart
-            ds.append(Line(*Vd))
-            Vd += (toInside * tabSign * dimpleHeight) - (direction * ddir * dimpleHeight)
-            ds.append(Line(*Vd))
-            Vd += toInside * (tabSign * dimpleLength)
-            ds.append(Line(*Vd))
-            Vd += (toInside * tabSign * dimpleHeight) + (direction * ddir * dimpleHeight)
-            ds.append(Line(*Vd))
-        return ds
+            return (
+                toInside * dimpleStart,
+                (toInside * tabSign * dimpleHeight) - (direction * ddir * dimpleHeight),
+                toInside * (tabSign * dimpleLength),
+                (toInside * tabSign * dimpleHeight) + (direction * ddir * dimpleHeight),
+            )
+        return ()
 
     def render_side(
         self,
@@ -1268,11 +1173,16 @@ class TabbedBoxMaker(CliEnabledGenerator):
 
         root = piece.base
 
-        for i in self.render_side_side(root, piece, side, settings) + \
-                ( self.render_side_slots(root, piece, side, settings)
-                    if piece.pieceType in [PieceType.YDivider, PieceType.XDivider]
-                    else self.render_side_holes(root, piece,side, settings)):
-            group.add(i)
+        nodes = self.render_side_side(root, piece, side, settings)
+
+        # Plain edges without dividers have no holes or slots to render
+        if side.num_dividers:
+            if piece.pieceType in (PieceType.YDivider, PieceType.XDivider):
+                nodes += self.render_side_slots(root, piece, side, settings)
+            else:
+                nodes += self.render_side_holes(root, piece, side, settings)
+
+        group.extend(nodes)
 
     def render_side_side(
         self,
@@ -1287,61 +1197,61 @@ class TabbedBoxMaker(CliEnabledGenerator):
 
         length = side.length
 
-        isMale = side.is_male
-        notMale = not isMale
         thickness = side.thickness
+        kerf = side.kerf
+        halfkerf = side.half_kerf
 
-        if side.has_tabs:
-            # Calculate direction
-            tabVec = -thickness if isMale else thickness
-        else:
-            tabVec = 0
+        toInside = side.to_inside
+        # Side outline as a flat point list, written straight to path data
+        s = []
 
-        kerf = settings.kerf
-        halfkerf = kerf / 2
-        dogbone = side.dogbone
+        startOffset = side.start_offset
 
-        divisions = side.divisions
-        gapWidth = side.gap_width
-        tabWidth = side.tab_width
+        vector = startOffset * thickness
 
+        s.append(vector)
 
-        if isMale:  # kerf correction
-            gapWidth -= settings.kerf
-            tabWidth += settings.kerf
-            first = kerf
-        else:
-            gapWidth += settings.kerf
-            tabWidth -= settings.kerf
-            first = 0
+        # A side without tabs is a single line to the end point; only sides
+        # with tabs need the tab and kerf correction set up below
+        if side.has_tabs:
+            isMale = side.is_male
+            notMale = not isMale
 
-        toInside = direction.rotate_clockwise(1)
-        s = Path()
+            # Calculate direction
+            tabVec = -thickness if isMale else thickness
 
-        startOffset = side.start_offset
-        vecHalfKerf = direction * halfkerf
+            dogbone = side.dogbone
+            vecHalfKerf = side.half_kerf_vec
 
-        vector = startOffset * thickness
+            divisions = side.divisions
+            gapWidth = side.gap_width
+            tabWidth = side.tab_width
 
-        s.append(Move(*vector))
+            if isMale:  # kerf correction
+                gapWidth -= kerf
+                tabWidth += kerf
+                first = kerf
+            else:
+                gapWidth += kerf
+                tabWidth -= kerf
+                first = 0
 
-        if side.has_tabs:
             if (side.has_tabs and side.prev.has_tabs and side.tab_symmetry == TabSymmetry.ROTATE_SYMMETRIC and piece.pieceType in [PieceType.Bottom, PieceType.Top]) or \
                     (side.has_tabs and side.prev.has_tabs and side.tab_symmetry == TabSymmetry.ANTISYMMETRIC and piece.pieceType ==  PieceType.Top and side.is_male and not (side.prev.has_tabs and side.prev.is_male)):
                 p = vector + toInside * -(thickness + halfkerf)
-                s.append(Line(*p))
+                s.append(p)
 
                 p += direction * (thickness + kerf)
-                s.append(Line(*p))
+                s.append(p)
 
                 ## TODO: Add dimple if necessary
                 p -= toInside * -(thickness + halfkerf)
-                s.append(Line(*p))
+                s.append(p)
             elif side.tab_symmetry == TabSymmetry.ANTISYMMETRIC and side.drop_start_tab:
                 vector += direction * (thickness + kerf)
-                s.append(Line(*vector))
+                s.append(vector)
                 vector += toInside * -(thickness + halfkerf)
-                s.append(Line(*vector))
+                s.append(vector)
 
 
             # Set vector for tab generation
@@ -1367,87 +1277,96 @@ class TabbedBoxMaker(CliEnabledGenerator):
             #   last co-ord:Vx,Vy ; tab dir:tabVec  ; direction:dirx,diry ; thickness:thickness
             #   divisions:divs ; gap width:gapWidth ; tab width:tabWidth
 
-            for tabDivision in range(1, int(divisions)):
-                if tabDivision % 2:
-                    # draw the gap
-                    vector += direction * (gapWidth + (kerf if dogbone and isMale else 0))
-                    s.append(Line(*vector))
-                    if dogbone and isMale:
-                        vector -= vecHalfKerf
-                        s.append(Line(*vector))
-                    # draw the starting edge of the tab
-                    s.extend(self.dimpleStr(
-                        tabVec, vector, direction, toInside, 1, isMale,
-                        settings.dimple_length, settings.dimple_height
-                    ))
-                    vector += toInside * tabVec
-                    s.append(Line(*vector))
-                    if dogbone and notMale:
-                        vector -= vecHalfKerf
-                        s.append(Line(*vector))
+            # The tab direction swaps every division, so the gaps always
+            # start with tabVec and the tabs with -tabVec: precompute the steps
+            gapStep = direction * (gapWidth + (kerf if dogbone and isMale else 0))
+            tabStep = direction * (tabWidth + (kerf if dogbone and notMale else 0))
+            gapEdge = toInside * tabVec
+            tabEdge = toInside * -tabVec
+            if settings.dimple_height > 0:
+                gapDimple = self.dimpleSteps(
+                    tabVec, direction, toInside, 1, isMale,
+                    settings.dimple_length, settings.dimple_height
+                )
+                tabDimple = self.dimpleSteps(
+                    -tabVec, direction, toInside, -1, isMale,
+                    settings.dimple_length, settings.dimple_height
+                )
+            else:
+                gapDimple = tabDimple = ()  # No dimples, skip the cache lookups
+
+            # Odd divisions draw a gap and the starting edge of a tab, even
+            # divisions a tab and its ending edge. Dogbones add a half kerf
+            # step before the edge on male gaps and female tabs, and after
+            # it on the others.
+            maleDogbone = dogbone and isMale
+            femaleDogbone = dogbone and notMale
+            phases = (
+                (tabStep, femaleDogbone, tabDimple, tabEdge, maleDogbone),
+                (gapStep, maleDogbone, gapDimple, gapEdge, femaleDogbone),
+            )
 
-                else:
-                    # draw the tab
-                    vector += direction * (tabWidth + (kerf if dogbone and notMale else 0))
-                    s.append(Line(*vector))
-                    if dogbone and notMale:
-                        vector -= vecHalfKerf
-                        s.append(Line(*vector))
-                    # draw the ending edge of the tab
-                    s.extend(self.dimpleStr(
-                        tabVec, vector, direction, toInside, -1, isMale,
-                        settings.dimple_length, settings.dimple_height
-                    ))
-                    vector += toInside * tabVec
-                    s.append(Line(*vector))
-                    if dogbone and isMale:
-                        vector -= vecHalfKerf
-                        s.append(Line(*vector))
-                tabVec = -tabVec  # swap tab direction
-            first = 0  # only apply first offset once
+            append = s.append
+            for tabDivision in range(1, int(divisions)):
+                step, dogboneBefore, dimple, edge, dogboneAfter = phases[tabDivision & 1]
+
+                vector += step
+                append(vector)
+                if dogboneBefore:
+                    vector -= vecHalfKerf
+                    append(vector)
+                if dimple:
+                    Vd = vector
+                    for dimpleStep in dimple:
+                        Vd += dimpleStep
+                        append(Vd)
+                vector += edge
+                append(vector)
+                if dogboneAfter:
+                    vector -= vecHalfKerf
+                    append(vector)
 
         end_point = side.next.start_offset * thickness + direction * (length + kerf)
         if side.tab_symmetry == TabSymmetry.ANTISYMMETRIC and piece.pieceType == PieceType.Bottom and side.is_male and not side.next.is_male and side.has_tabs and side.next.has_tabs:
             # Antisymmetric case for bottom side, we need an additional corner to avoid a void
             p = end_point - direction * (thickness + kerf)
 
-            s.append(Line(*p))
+            s.append(p)
 
             ## TODO: Add dimple if necessary
             p += toInside * -(thickness + halfkerf)
-            s.append(Line(*p))
+            s.append(p)
 
             p += direction * (thickness + kerf)
-            s.append(Line(*p))
+            s.append(p)
 
 
         # finish the line off
-        s.append(Line(*end_point))
+        s.append(end_point)
 
-        rootX, rootY = root + side.root_offset + direction * -halfkerf + toInside * -halfkerf
+        offset = root + side.root_offset + direction * -halfkerf + toInside * -halfkerf
 
-        sidePath = self.makeLine(s.translate(rootX, rootY, inplace=True), "side")
+        sidePath = self.makeLine(points_to_d(s, close=False, offset=offset), "side")
         return [sidePath]
 
     # Calculate cumulative positions for dividers
     @staticmethod
-    def calculate_cumulative_position(divider_number: int, divider_spacings: list[float], side_thickness: float) -> float:
-        """Calculate cumulative position for divider number (1-based)"""
+    def calculate_cumulative_positions(num_dividers: int, divider_spacings: list[float], side_thickness: float) -> list[float]:
+        """Calculate the cumulative positions of dividers 1 to num_dividers in
+        a single pass"""
 
         if not divider_spacings:
-            return 0  # No custom spacing provided, fall back to default even spacing calculation
+            return [0] * num_dividers
 
+        positions = []
         cumulative = 0
-        # Divider N comes after section N, so add sections 1 through N
-        for i in range(divider_number):
-            if i < len(divider_spacings):
+        num_spacings = len(divider_spacings)
+        for i in range(num_dividers):
+            if i < num_spacings:
                 cumulative += divider_spacings[i]
-            else:
-                # This should not happen as parse_divider_spacing should fill all slots
-                break
-
-        return cumulative + side_thickness * i
+            positions.append(cumulative + side_thickness * min(i, num_spacings))
 
+        return positions
 
     def render_side_slots(
         self,
@@ -1468,48 +1387,48 @@ class TabbedBoxMaker(CliEnabledGenerator):
 
         direction = side.direction
         thickness = side.thickness
-        kerf = settings.kerf
-        halfkerf = kerf / 2
+        dogbone = side.dogbone
+        kerf = side.kerf
+        halfkerf = side.half_kerf
 
         nodes = []
 
-        toInside = direction.rotate_clockwise(1)
+        toInside = side.to_inside
         vector = root + side.root_offset + toInside * side.has_tabs * thickness
         kerf_offset = toInside * halfkerf
+        thickVec = toInside * (thickness - kerf)
 
+        width = side.inside_length / 2
+        if side.prev.has_tabs:
+            width += thickness
+        widthVec = direction * width
+        vecHalfKerf = side.half_kerf_vec
+        makeLine = self.makeLine
 
-        for dividerNumber in range(numDividers):
-            cumulative_position = self.calculate_cumulative_position(dividerNumber + 1, divider_spacings, thickness)
-            divider_offset = direction.rotate_clockwise(1) * cumulative_position
-
-            start_pos = vector + divider_offset + kerf_offset - direction * halfkerf
-            width = side.inside_length / 2
+        for cumulative_position in self.calculate_cumulative_positions(numDividers, divider_spacings, thickness):
+            divider_offset = toInside * cumulative_position
 
-            if side.prev.has_tabs:
-                width += thickness
+            start_pos = vector + divider_offset + kerf_offset - vecHalfKerf
 
-            h = Path()
-            h.append(Move(*start_pos))
+            # Slot outline as a flat point list, written straight to path data
+            h = [start_pos]
 
-            pos = start_pos + direction * width
-            if side.dogbone:
-                db = pos + direction * halfkerf
-                h.append(Line(*db))
-            h.append(Line(*pos))
+            pos = start_pos + widthVec
+            if dogbone:
+                h.append(pos + vecHalfKerf)
+            h.append(pos)
 
-            pos += toInside * (thickness - kerf)
-            h.append(Line(*pos))
+            pos += thickVec
+            h.append(pos)
 
-            if side.dogbone:
-                db = pos + direction * halfkerf
-                h.append(Line(*db))
+            if dogbone:
+                h.append(pos + vecHalfKerf)
 
-            pos -= direction * width
-            h.append(Line(*pos))
+            pos -= widthVec
+            h.append(pos)
 
-            h.append(Line(*start_pos))
-            h.append(ZoneClose())
-            nodes.append(self.makeLine(h, "slot"))
+            h.append(start_pos)
+            nodes.append(makeLine(points_to_d(h), "slot"))
 
         return nodes
 
@@ -1531,18 +1450,19 @@ class TabbedBoxMaker(CliEnabledGenerator):
         direction = side.direction
 
         isMale = side.is_male
+        tabSymmetry = side.tab_symmetry
 
-        if side.tab_symmetry == TabSymmetry.ROTATE_SYMMETRIC:
+        if tabSymmetry == TabSymmetry.ROTATE_SYMMETRIC:
             if side.name in (Sides.B, Sides.D) and piece.pieceType != PieceType.Top:
                 isMale = not isMale  # swap tab type for rotate symmetry.
-        elif side.tab_symmetry == TabSymmetry.ANTISYMMETRIC:
+        elif tabSymmetry == TabSymmetry.ANTISYMMETRIC:
             if side.name in (Sides.B, Sides.D) and piece.pieceType in (PieceType.Bottom, PieceType.Back, PieceType.Front):
                 isMale = not isMale  # swap tab type for antisymmetry.
 
         thickness = side.thickness
 
-        kerf = settings.kerf
-        halfkerf = kerf / 2
+        kerf = side.kerf
+        halfkerf = side.half_kerf
 
         nodes = []
 
@@ -1556,86 +1476,97 @@ class TabbedBoxMaker(CliEnabledGenerator):
         gapWidth += corr
         tabWidth -= corr
 
-        toInside = direction.rotate_clockwise()
-
-        kerf_offset = Vec(1 if toInside.x else 0, -(1 if toInside.y else 0)) * halfkerf
+        toInside = side.to_inside
 
         vector = root + side.root_offset + toInside * (side.has_tabs * thickness + halfkerf)
 
-        if side.tab_symmetry == TabSymmetry.ROTATE_SYMMETRIC:
-            vector += direction * (side.prev.has_tabs * thickness - halfkerf)
+        prevHasTabs = side.prev.has_tabs
+        nextHasTabs = side.next.has_tabs
+        dogbone = side.dogbone
+        correctEnds = tabSymmetry in (TabSymmetry.XY_SYMMETRIC, TabSymmetry.ANTISYMMETRIC)
+
+        if tabSymmetry == TabSymmetry.ROTATE_SYMMETRIC:
+            vector += direction * (prevHasTabs * thickness - halfkerf)
 
         kerf_offset = Vec(1 if toInside.x else 0, -(1 if toInside.y else 0)) * halfkerf
+        thickVec = toInside * (thickness - kerf)
+        vecHalfKerf = side.half_kerf_vec
+        makeLine = self.makeLine
+
+        # The divider offsets are the same for every division
+        divider_offsets = [
+            toInside * (cumulative_position + halfkerf)
+            for cumulative_position in self.calculate_cumulative_positions(numDividers, dividerSpacings, thickness)
+        ]
+
+        def add_holes(start: Vec, holeLen: Vec, holeDogbone: bool, shift: Vec | None = None) -> None:
+            """Add one hole per divider for the division starting at start"""
+            for divider_offset in divider_offsets:
+                pos = start + divider_offset + kerf_offset
+
+                if shift is not None:
+                    pos += shift
+
+                # Hole outline as a flat point list, written straight to path data
+                h = [pos]
+                if holeDogbone:
+                    h.append(pos - vecHalfKerf)
+
+                pos += holeLen
+                if holeDogbone:
+                    h.append(pos + vecHalfKerf)
+                h.append(pos)
+
+                pos += thickVec
+                h.append(pos)
+
+                if holeDogbone:
+                    h.append(pos + vecHalfKerf)
+
+                pos -= holeLen
+
+                if holeDogbone:
+                    h.append(pos - vecHalfKerf)
+
+                h.append(pos)
+
+                pos -= thickVec
+                #if holeDogbone:
+                #    h.append(pos - vecHalfKerf)
+                h.append(pos)
+                nodes.append(makeLine(points_to_d(h), "hole"))
+
+        if divisions < 1:
+            return nodes
+
+        # The first division is always a gap; it carries the kerf offset and
+        # is a hole only on male sides, where it may need a corner correction.
+        if isMale:
+            ww = w = gapWidth
+            shift = None
+            if correctEnds and prevHasTabs:
+                w -= thickness - halfkerf
+                shift = direction * (prevHasTabs * thickness - halfkerf)
+            add_holes(vector, direction * (w + first), dogbone and ww == w, shift)
+
+        vector += direction * (gapWidth + first)
 
         # generate line as tab or hole using:
         #   last co-ord:Vx,Vy ; tab dir:tabVec  ; direction:dirx,diry ; thickness:thickness
         #   divisions:divs ; gap width:gapWidth ; tab width:tabWidth
-        for tabDivision in range(divisions):
+        for tabDivision in range(1, divisions):
             # draw holes for divider tabs to key into side walls
-            if ((tabDivision % 2) == 0) != (not isMale):
+            if ((tabDivision % 2) == 0) == isMale:
                 ww = w = gapWidth if isMale else tabWidth
-                width_correction = False
-                if (tabDivision == 0 or tabDivision == (divisions - 1)) and (side.tab_symmetry == TabSymmetry.XY_SYMMETRIC or side.tab_symmetry == TabSymmetry.ANTISYMMETRIC):
-                    if tabDivision == 0 and side.prev.has_tabs:
-                        width_correction = True
-                    elif tabDivision > 0 and side.next.has_tabs:
-                        width_correction = True
-
-                if width_correction:
-                    w -= thickness - (halfkerf if tabDivision == 0 else kerf)
-                holeLen = direction * (w + first)
-                for dividerNumber in range(numDividers):
-                    cumulative_position = self.calculate_cumulative_position(dividerNumber + 1, dividerSpacings, thickness)
-                    divider_offset = direction.rotate_clockwise(1) * (cumulative_position + halfkerf)
-
-                    pos = vector + divider_offset + kerf_offset
-
-                    if tabDivision == 0 and width_correction:
-                        pos += direction * (side.prev.has_tabs * thickness - halfkerf)
-
-                    h = Path()
-                    h.append(Move(*pos))
-                    if side.dogbone and ww == w:
-                        db = pos - direction * halfkerf
-                        h.append(Line(*db))
-
-                    pos += holeLen
-                    if side.dogbone and ww == w:
-                        db = pos + direction * halfkerf
-                        h.append(Line(*db))
-                    h.append(Line(*pos))
-
-                    thickVec = toInside * (thickness - kerf)
-                    pos += thickVec
-                    h.append(Line(*pos))
-
-                    if side.dogbone and ww == w:
-                        db = pos + direction * halfkerf
-                        h.append(Line(*db))
-
-                    pos -= holeLen
-
-                    if side.dogbone and ww == w:
-                        db = pos - direction * halfkerf
-                        h.append(Line(*db))
-
-                    h.append(Line(*pos))
-
-                    pos -= thickVec
-                    #if side.dogbone and ww == w:
-                    #    db = pos - direction * halfkerf
-                    #    h.append(Line(*db))
-                    h.append(Line(*pos))
-                    h.append(ZoneClose())
-                    nodes.append(self.makeLine(h, "hole"))
+                if tabDivision == (divisions - 1) and correctEnds and nextHasTabs:
+                    w -= thickness - kerf
+                add_holes(vector, direction * w, dogbone and ww == w)
 
             if (tabDivision % 2) == 0:
                 # draw the gap
-                vector += direction * (gapWidth + first)
+                vector += direction * gapWidth
             else:
                 # draw the tab
                 vector += direction * tabWidth
 
-            first = 0
-
         return nodes
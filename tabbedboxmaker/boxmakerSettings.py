@@ -1,6 +1,8 @@
 from __future__ import annotations
+from copy import copy
 from dataclasses import dataclass
 from enum import Enum, IntEnum
+from operator import itemgetter
 from typing import Optional
 from typing import Union
 
@@ -60,7 +62,7 @@ class Sides(IntEnum):
     D = 3
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoxSettings:
     X: float
     Y: float
@@ -102,9 +104,10 @@ class BoxSettings:
     rail_mount_radius: float
     cutout: bool
     combine: bool
+    coordinate_decimals: int | None  # Round line coordinates (None = full precision)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SchroffSettings:
     """Schroff-specific settings when schroff mode is enabled"""
     rows: int
@@ -116,7 +119,7 @@ class SchroffSettings:
     rail_mount_radius: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TabConfiguration:
     """Tab information for each face"""
     tpTabInfo: int
@@ -135,16 +138,14 @@ class TabConfiguration:
 
 class Vec(tuple):
     """Simple 2D vector class for basic operations"""
-    x: float
-    y: float
+    __slots__ = ()
+
+    x = property(itemgetter(0), doc="X component")
+    y = property(itemgetter(1), doc="Y component")
 
     def __new__(cls, x : float, y : float):
         return super().__new__(cls, (x, y))
 
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
-
     def __add__(self, other: "Vec") -> "Vec":
         return Vec(self.x + other.x, self.y + other.y)
 
@@ -191,17 +192,22 @@ class Vec(tuple):
         return Vec(v.real, v.imag)
 
 
-@dataclass
+@dataclass(slots=True)
 class Side:
     name: Sides
     is_male: bool
     has_tabs: bool
     direction: Vec
+    to_inside: Vec  # direction rotated a quarter turn, pointing into the piece
     tab_symmetry: TabSymmetry
     divisions: int
     tab_width: float
     gap_width: float
     thickness: float
+    dogbone: bool
+    kerf: float
+    half_kerf: float
+    half_kerf_vec: Vec  # direction scaled to half the kerf
     pieceType : PieceType
     inside_length: float = 0.0  # Inside dimension
     line_thickness: float = 0.1  # default line thickness
@@ -280,13 +286,23 @@ class Side:
         self.inside_length = inside_length  # Inside dimension passed explicitly
         self.pieceType = pieceType
         self.divider_spacings = []
+        self.num_dividers = 0
+
+        # Slotted instances have no class-level fallbacks, so set these up
+        # front; Piece links the sides and fills in the offsets later on.
+        self.prev = self.next = None
+        self.root_offset = self.start_offset = Vec(0, 0)
 
         baseDirection = Vec(1, 0)  # default direction
 
         self.direction = baseDirection.rotate_clockwise(name)  # Rotate direction based on side name (A=0°, B=90°, C=180°, D=270°)
+        self.to_inside = self.direction.rotate_clockwise(1)
         self.tab_symmetry = settings.tab_symmetry
         self.tab_width = self.base_tab_width = settings.tab_width
         self.thickness = settings.thickness
+        self.kerf = settings.kerf
+        self.half_kerf = self.kerf / 2
+        self.half_kerf_vec = self.direction * self.half_kerf
         self.line_thickness = settings.line_thickness
         self.dogbone = settings.dogbone
         self.equal_tabs = settings.equal_tabs
@@ -320,7 +336,16 @@ class Side:
             self.gap_width = (length - tabs * self.tab_width) / (self.divisions - tabs)
 
 
-@dataclass
+# Root offset of each side within its piece, indexed by Sides
+_ROOT_OFFSETS = (
+    lambda side: Vec(0, 0),                                # A
+    lambda side: Vec(side.prev.length, 0),                 # B
+    lambda side: Vec(side.length, side.prev.length),       # C
+    lambda side: Vec(0, side.length),                      # D
+)
+
+
+@dataclass(slots=True)
 class Piece:
     """A piece of the box with its sides and positioning"""
     sides: list[Side]
@@ -341,7 +366,18 @@ class Piece:
         self.sides = sides
         self.pieceType = pieceType
 
-        # Link sides together
+        self._link_sides()
+
+        # Initialize at (0,0) - positioning happens in layout phase
+        self.base = Vec(0, 0)
+
+        # Phase 2.1: Calculate geometric offsets for each side
+        # Keep alongside old system for verification before switching
+        self._calculate_geometric_offsets()
+
+    def _link_sides(self):
+        """Link the sides together"""
+        sides = self.sides
         sides[0].next = sides[1]
         sides[1].next = sides[2]
         sides[2].next = sides[3]
@@ -351,12 +387,15 @@ class Piece:
         sides[2].prev = sides[1]
         sides[3].prev = sides[2]
 
-        # Initialize at (0,0) - positioning happens in layout phase
-        self.base = Vec(0, 0)
+    def copy(self) -> Piece:
+        """Return an identical piece with its own sides.
 
-        # Phase 2.1: Calculate geometric offsets for each side
-        # Keep alongside old system for verification before switching
-        self._calculate_geometric_offsets()
+        The sides are shallow copies linked to each other, so the calculated
+        offsets are reused instead of being calculated again."""
+        piece = copy(self)
+        piece.sides = [copy(side) for side in self.sides]
+        piece._link_sides()
+        return piece
 
     def _calculate_geometric_offsets(self):
         """Calculate geometric offsets for each side based on neighboring side properties.
@@ -378,19 +417,11 @@ class Piece:
 
         for side in self.sides:
             # These calculations mirror the offs_cases logic in render functions
-            if side.name == Sides.A:
-                side.root_offset = Vec(0, 0)
-            elif side.name == Sides.B:
-                side.root_offset = Vec(side.prev.length, 0)
-            elif side.name == Sides.C:
-                side.root_offset = Vec(side.length, side.prev.length)
-            elif side.name == Sides.D:
-                side.root_offset = Vec(0, side.length)
-
+            side.root_offset = _ROOT_OFFSETS[side.name](side)
             side.start_offset = Vec(side.prev.end_hole, side.start_hole).rotate_clockwise(side.name)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoxConfiguration:
     """Complete box configuration including all computed settings"""
     schroff_settings: Optional[SchroffSettings]
@@ -27,20 +27,39 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from inkex import PathElement, Metadata, Transform, Desc
 from inkex.paths import Path
 
-from tabbedboxmaker.Generators import CliEnabledGenerator
+from tabbedboxmaker.Generators import CliEnabledGenerator, line_style
 from tabbedboxmaker.boxmaker import IntBoolean
 
+import atexit
 import os
 import inkex
 import gettext
 
 _ = gettext.gettext
 
+_log_file = None
+_log_path = None
+
+
+def _close_log():
+    if _log_file is not None:
+        _log_file.close()
+
 
 def log(text):
-    if "SCHROFF_LOG" in os.environ:
-        f = open(os.environ.get("SCHROFF_LOG"), "a")
-        f.write(text + "\n")
+    global _log_file, _log_path
+    path = os.environ.get("SCHROFF_LOG")
+    if path is not None:
+        # Keep the log open (buffered) until the process exits, re-opening
+        # it when SCHROFF_LOG points somewhere else
+        if path != _log_path:
+            if _log_file is None:
+                atexit.register(_close_log)
+            else:
+                _log_file.close()
+            _log_file = open(path, "a")
+            _log_path = path
+        _log_file.write(text + "\n")
 
 # Draws each top or bottom edge
 # Sidenumber is 1-4
@@ -343,13 +362,14 @@ class CardboardBoxMaker(CliEnabledGenerator):
         else:
             self.linethickness = 1
 
-        hh = self.svg.unittouu(str(self.options.width) + unit)
-        ww = self.svg.unittouu(str(self.options.length) + unit)
-        dd = self.svg.unittouu(str(self.options.depth) + unit)
-        t2 = self.svg.unittouu(str(self.options.thickness * 2) + unit)
-        t5 = self.svg.unittouu(str(self.options.thickness * 5) + unit)
-        k = self.svg.unittouu(str(self.options.kerf) + unit)
-        k1 = self.svg.unittouu(str(self.options.kerf) + unit)
+        uu = self.unit_converter(unit)
+        hh = uu(self.options.width)
+        ww = uu(self.options.length)
+        dd = uu(self.options.depth)
+        t2 = uu(self.options.thickness * 2)
+        t5 = uu(self.options.thickness * 5)
+        k = uu(self.options.kerf)
+        k1 = uu(self.options.kerf)
         k2 = k1 * 2
 
         if ((boxtop == 4) or (boxbottom == 4)) and ((dd * 3) > ww):
@@ -531,9 +551,9 @@ class CardboardBoxMaker(CliEnabledGenerator):
         line = PathElement(id=self.makeId('line'))
 
         if linethickness == self.raw_hairline_thickness:
-            line.style = { "stroke": stroke, "stroke-width"  : str(self.hairline_thickness), "fill": "none", "vector-effect": "non-scaling-stroke", "-inkscape-stroke": "hairline" }
+            line.attrib["style"] = line_style(stroke, str(self.hairline_thickness), hairline=True)
         else:
-            line.style = { "stroke": stroke, "stroke-width"  : str(linethickness), "fill": "none" }
+            line.attrib["style"] = line_style(stroke, str(linethickness))
 
         line.path = XYstring
         return line
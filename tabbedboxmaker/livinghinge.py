@@ -20,7 +20,6 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 '''
 
-from copy import deepcopy
 import inkex
 import gettext
 import math
@@ -31,8 +30,8 @@ from inkex import Desc, Group, PathElement, Metadata
 from inkex.paths import Path
 
 from tabbedboxmaker.InkexShapely import try_attach_paths, adjust_canvas
-from tabbedboxmaker.boxmaker import IntBoolean
-from tabbedboxmaker.Generators import CliEnabledGenerator
+from tabbedboxmaker.boxmaker import BoxMakerValidationError, IntBoolean
+from tabbedboxmaker.Generators import CliEnabledGenerator, line_style
 
 _ = gettext.gettext
 
@@ -200,9 +199,9 @@ class LivingHingeBoxMaker(CliEnabledGenerator):
         line = PathElement(id=self.makeId(prefix))
 
         if self.line_thickness == self.raw_hairline_thickness:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.hairline_thickness), "fill": "none", "vector-effect": "non-scaling-stroke", "-inkscape-stroke": "hairline" }
+            line.attrib["style"] = line_style(self.line_color, str(self.hairline_thickness), hairline=True)
         else:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.line_thickness), "fill": "none" }
+            line.attrib["style"] = line_style(self.line_color, str(self.line_thickness))
 
         line.path = Path(XYstring)
 
@@ -215,9 +214,9 @@ class LivingHingeBoxMaker(CliEnabledGenerator):
         line = PathElement.arc((centerx, centery), radiusx, ry=radiusy, start=start_end[0], end=start_end[1], arctype='arc', open=True, id=self.makeId(prefix))
 
         if self.line_thickness == self.raw_hairline_thickness:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.hairline_thickness), "fill": "none", "vector-effect": "non-scaling-stroke", "-inkscape-stroke": "hairline" }
+            line.attrib["style"] = line_style(self.line_color, str(self.hairline_thickness), hairline=True)
         else:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.line_thickness), "fill": "none" }
+            line.attrib["style"] = line_style(self.line_color, str(self.line_thickness))
 
         self.parent.add(line)
 
@@ -229,9 +228,9 @@ class LivingHingeBoxMaker(CliEnabledGenerator):
 
 
         if self.line_thickness == self.raw_hairline_thickness:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.hairline_thickness), "fill": "none", "vector-effect": "non-scaling-stroke", "-inkscape-stroke": "hairline" }
+            line.attrib["style"] = line_style(self.line_color, str(self.hairline_thickness), hairline=True)
         else:
-            line.style = { "stroke": self.line_color, "stroke-width"  : str(self.line_thickness), "fill": "none" }
+            line.attrib["style"] = line_style(self.line_color, str(self.line_thickness))
 
         line.path = 'M '+str(x1)+','+str(y1)+' L '+str(x2)+','+str(y2)
 
@@ -382,8 +381,9 @@ class LivingHingeBoxMaker(CliEnabledGenerator):
 
         (Sx, Sy), (Ex, Ey) = a1, a2
 
-        space = self.svg.unittouu( str(space)  + unit )
-        solidGap = self.svg.unittouu( str(solidGap)  + unit )
+        uu = self.unit_converter(unit)
+        space = uu(space)
+        solidGap = uu(solidGap)
         Sy += thickness
         Ey -= thickness
 
@@ -419,7 +419,8 @@ class LivingHingeBoxMaker(CliEnabledGenerator):
         """
 
         (Sx, Sy), (Ex, Ey) = a1, a2
-        space = self.svg.unittouu( str(space)  + unit )
+        uu = self.unit_converter(unit)
+        space = uu(space)
 
         height = (Ey - Sy)
 
@@ -461,8 +462,9 @@ class LivingHingeBoxMaker(CliEnabledGenerator):
 
         (Sx, Sy), (Ex, Ey) = a1, a2
 
-        space = self.svg.unittouu( str(space)  + unit )
-        solidGap = self.svg.unittouu( str(solidGap)  + unit )
+        uu = self.unit_converter(unit)
+        space = uu(space)
+        solidGap = uu(solidGap)
         Sy += thickness
         Ey -= thickness
 
@@ -524,27 +526,29 @@ class LivingHingeBoxMaker(CliEnabledGenerator):
         if unit == 'document':
             unit = svg.document_unit
 
+        uu = self.unit_converter(unit)
+
         hairline = self.options.hairline
-        self.line_thickness = self.hairline_thickness if hairline else self.svg.unittouu(str(self.options.line_thickness) + unit)
+        self.line_thickness = self.hairline_thickness if hairline else uu(self.options.line_thickness)
         if self.line_thickness == 1.0:
             self.line_thickness = 1 # Reproduce old output
 
         self.line_color = {'black': '#000000', 'red': '#FF0000', 'green': '#00FF00', 'blue': '#0000FF'}.get(str(self.options.color).lower(), "#000000")
 
         inside=self.options.inside
-        X = self.svg.unittouu( str(self.options.length)  + unit )
-        Y = self.svg.unittouu( str(self.options.width) + unit )
-        Z = self.svg.unittouu( str(self.options.height)  + unit )
-        thickness = float(self.svg.unittouu( str(self.options.thickness)  + unit ))
-        nomTab = self.svg.unittouu( str(self.options.tab) + unit )
+        X = uu(self.options.length)
+        Y = uu(self.options.width)
+        Z = uu(self.options.height)
+        thickness = uu(self.options.thickness)
+        nomTab = uu(self.options.tab)
         equalTabs=self.options.equal
-        kerf = self.svg.unittouu( str(self.options.kerf)  + unit )
-        clearance = self.svg.unittouu( str(self.options.clearance)  + unit )
+        kerf = uu(self.options.kerf)
+        clearance = uu(self.options.clearance)
         layout=self.options.style
-        spacing = self.svg.unittouu( str(self.options.spacing)  + unit )
+        spacing = uu(self.options.spacing)
         hingeOpt = self.options.hingeOpt
         hingeThick = self.options.hingeThick
-        thumbTab = self.svg.unittouu( str(self.options.thumbTab) + unit ) if self.options.thumbTab else None
+        thumbTab = uu(self.options.thumbTab) if self.options.thumbTab else None
 
         if inside: # if inside dimension selected correct values to outside dimension
             X+=thickness*2
@@ -556,38 +560,33 @@ class LivingHingeBoxMaker(CliEnabledGenerator):
         # check input values mainly to avoid python errors
         # TODO restrict values to *correct* solutions
         # TODO -- Do what the origial author suggested I do. QUALITY!
-        error=0
-
-        if min(X, Y, Z)==0:
-            inkex.errormsg(_('Error: Dimensions must be non zero'))
-            error=1
-        if max(X, Y, Z)>max(widthDoc, heightDoc)*10: # crude test
-            inkex.errormsg(_('Error: Dimensions Too Large'))
-            error=1
-        if min(X, Y, Z)<3*nomTab:
-            inkex.errormsg(_('Error: Tab size too large'))
-            error=1
+        errors = []
+        mn = min(X, Y, Z)
+        mx = max(X, Y, Z)
+
+        if mn==0:
+            errors.append(_('Error: Dimensions must be non zero'))
+        if mx>max(widthDoc, heightDoc)*10: # crude test
+            errors.append(_('Error: Dimensions Too Large'))
+        if mn<3*nomTab:
+            errors.append(_('Error: Tab size too large'))
         if nomTab<thickness:
-            inkex.errormsg(_('Error: Tab size too small'))
-            error=1
+            errors.append(_('Error: Tab size too small'))
         if thickness==0:
-            inkex.errormsg(_('Error: Thickness is zero'))
-            error=1
-        if thickness>min(X, Y, Z)/3: # crude test
-            inkex.errormsg(_('Error: Material too thick'))
-            error=1
-        if correction>min(X, Y, Z)/3: # crude test
-            inkex.errormsg(_('Error: Kerf/Clearence too large'))
-            error=1
-        if spacing>max(X, Y, Z)*10: # crude test
-            inkex.errormsg(_('Error: Spacing too large'))
-            error=1
+            errors.append(_('Error: Thickness is zero'))
+        if thickness>mn/3: # crude test
+            errors.append(_('Error: Material too thick'))
+        if correction>mn/3: # crude test
+            errors.append(_('Error: Kerf/Clearence too large'))
+        if spacing>mx*10: # crude test
+            errors.append(_('Error: Spacing too large'))
         if spacing<kerf: #if spacing is less then kerf, the laser cuts will overlap and blast meaningful material.
-            inkex.errormsg(_('Error: Spacing too small'))
-            error=1
+            errors.append(_('Error: Spacing too small'))
 
-        if error:
-            exit()
+        if errors:
+            for message in errors:
+                inkex.errormsg(message)
+            raise BoxMakerValidationError("; ".join(errors))
 
         # layout format:(rootx), (rooty), Xlength, Ylength, tabInfo
         # root= (spacing, X, Y, Z) * values in tuple
@@ -2,13 +2,14 @@ import io
 import os
 import pytest
 import re
+from inkex import PathElement
 from inkex.paths import Path
 
 import xml.dom.minidom
-from tabbedboxmaker.InkexShapely import path_to_polygon
+from tabbedboxmaker.InkexShapely import path_to_polygon, round_paths
 from collections.abc import Iterable
 
-from tabbedboxmaker import TabbedBoxMaker
+from tabbedboxmaker import TabbedBoxMaker, BoxMakerValidationError
 from tabbedboxmaker.boxmakerSettings import DividerKeying
 
 from shapely.affinity import translate
@@ -590,11 +591,14 @@ expected_output_dir = os.path.join(os.path.dirname(__file__), "..", "expected")
 actual_output_dir = os.path.join(os.path.dirname(__file__), "..", "actual")
 
 
-def make_box(args, make_relative=False, optimize=False, mask=True, no_subtract=False, force_interiors=False) -> str:
+def make_box(args, make_relative=False, optimize=False, mask=True, no_subtract=False, force_interiors=False, coordinate_decimals=None) -> str:
     """Run one test case and return (output, expected) strings."""
 
     outfh = io.BytesIO()
 
+    if coordinate_decimals is not None:
+        args = args + [f"--coordinate-decimals={coordinate_decimals}"]
+
     boxmaker = TabbedBoxMaker(cli=True)
     boxmaker.parse_arguments(args)
 
@@ -944,6 +948,61 @@ def test_outside_sizes_kerf():
     assert sizes == [(30, 40), (30, 40) , (20, 40), (20, 40), (20, 30), (20, 30)], f"Sizes incorrect: {sizes}"
 
 
+@pytest.mark.parametrize("optimize", [False, True])
+def test_coordinate_decimals(optimize):
+    args = [
+            "--unit=in",
+            "--length=3.3",
+            "--width=2.7",
+            "--depth=1.9",
+            "--tab=0.3",
+            "--thickness=0.13",
+            "--kerf=0.007",
+            "--div-l=1",
+            "--div-w=2"]
+
+    output = make_box(args, optimize=optimize, mask=False, coordinate_decimals=3)
+
+    for d in re.findall(r'(?<=\bd=")M [^"]*(?=")', output):
+        for seg in Path(d):
+            for v in seg.args:
+                assert round(v, 3) == v, f"Coordinate {v} not rounded to 3 decimals"
+
+
+def test_round_paths_keeps_arcs():
+    line = PathElement()
+    line.path = "M 1.23456 -0.0001 L 2.34567 3.45678 Z"
+    circle = PathElement.arc((1.23456, 2.34567), 1.5)
+    circle_d = circle.get("d")
+
+    round_paths([line, circle], 2)
+
+    assert str(line.path) == "M 1.23 0 L 2.35 3.46 Z"
+    assert circle.get("d") == circle_d
+
+
+@pytest.mark.parametrize("args", [
+    ["--thickness=0"],
+    ["--tab=100"],
+    ["--div-l=2", "--div-l-spacing=10;10;10;10"],
+], ids=["thickness", "tab", "divider-spacing"])
+def test_invalid_settings_raise(args):
+    with pytest.raises(BoxMakerValidationError):
+        make_box(["--length=80", "--width=100", "--depth=40", "--tab=10", "--thickness=3"] + args)
+
+
+@pytest.mark.parametrize("spacings,expected", [
+    ([], [0, 0, 0, 0, 0]),
+    ([10.0], [10.0, 13.1, 13.1, 13.1, 13.1]),
+    ([10.0, 12.5, 7.25], [10.0, 25.6, 35.95, 39.05, 39.05]),
+    ([3.3, 4.4, 5.5, 6.6], [3.3, 10.8, 19.4, 29.1, 32.2]),
+], ids=["even", "one", "three", "four"])
+def test_cumulative_positions(spacings, expected):
+    for num_dividers in range(0, 6):
+        positions = TabbedBoxMaker.calculate_cumulative_positions(num_dividers, spacings, 3.1)
+        assert positions == pytest.approx(expected[:num_dividers])
+
+
 def test_output_kerf():
     kerf = 0.5
     args = [
@@ -1338,3 +1397,30 @@ def test_hole_placement():
                         if ydiv:
                             holes = get_hole_points(back, reverse=True)
                             assert ydiv_info[2] == holes[1], f"Back holes do not match ydivider for ({bt, sym, keydiv}: {" " .join(args)}"
+
+
+def test_shared_parser_skips_subclass_options():
+    calls = []
+
+    class ExtendedBoxMaker(TabbedBoxMaker):
+        def add_arguments(self, pars):
+            super().add_arguments(pars)
+            calls.append(self)
+            pars.add_argument("--extra", type=int, default=1)
+
+    first = ExtendedBoxMaker(cli=True)
+    second = ExtendedBoxMaker(cli=True)
+    assert second.arg_parser is first.arg_parser
+    assert calls == [first]
+    second.parse_arguments(["--extra=2"])
+    assert second.options.extra == 2
+
+
+def test_unit_converter_rejects_unknown_unit():
+    boxmaker = TabbedBoxMaker(cli=True)
+    boxmaker.parse_arguments([])
+    boxmaker.load_raw()
+
+    assert boxmaker.unit_converter("in")(1) == pytest.approx(25.4)
+    with pytest.raises(ValueError, match="furlong"):
+        boxmaker.unit_converter("furlong")
@@ -7,7 +7,7 @@ from inkex.paths import Path
 import xml.dom.minidom
 
 from tabbedboxmaker.InkexShapely import path_to_polygon
-from tabbedboxmaker import LivingHingeBoxMaker
+from tabbedboxmaker import LivingHingeBoxMaker, BoxMakerValidationError
 
 from shapely.geometry import Polygon
 
@@ -338,3 +338,12 @@ def test_hinge_optimized(case):
     assert (
         output == expected
     ), f"Test case {name} failed - optimized output doesn't match expected"
+
+
+@pytest.mark.parametrize("args", [
+    ["--thickness=0"],
+    ["--tab=100"],
+], ids=["thickness", "tab"])
+def test_invalid_settings_raise(args):
+    with pytest.raises(BoxMakerValidationError):
+        make_box(["--length=80", "--width=100", "--depth=40", "--tab=10", "--thickness=3"] + args)